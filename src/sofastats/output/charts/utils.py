@@ -5,6 +5,8 @@ from sofastats import logger
 from sofastats.conf.main import (AVG_CHAR_WIDTH_PIXELS, AVG_LINE_HEIGHT_PIXELS, DOJO_Y_AXIS_TITLE_OFFSET_PIXELS,
     GAP_BEFORE_FIRST_X_LABEL_TICK_PIXELS, PADDING_TO_RIGHT_OF_Y_AXIS_VALUES_PIXELS)
 
+_DEBUG_WIDTH = False  ## flip on to log the width workings below (keeps the big f-string out of the normal path)
+
 def get_width_after_left_margin(*,
         n_x_items: int, n_items_horizontally_per_x_item: int, min_pixels_per_sub_item: int,
         x_item_padding_pixels: int, sub_item_padding_pixels: int,
@@ -57,7 +59,6 @@ def get_width_after_left_margin(*,
         show_major_ticks_only: we want to only see the main labels and won't need it to be so wide
           (only applicable to line and area charts)
     """
-    debug = False
     item_min_width_from_sub_item_contents = (
         (min_pixels_per_sub_item * n_items_horizontally_per_x_item)  ## sub-items
         + ((n_items_horizontally_per_x_item- 1) * sub_item_padding_pixels)  ## in-between padding
@@ -83,8 +84,8 @@ def get_width_after_left_margin(*,
     if show_major_ticks_only:
         min_chart_width = 1.5 * min_chart_width
     width = max(width_from_content, min_chart_width)
-    if debug:
-        print(f"""
+    if _DEBUG_WIDTH:
+        logger.debug(f"""
         ********************************************************************************************************
         width: {width}
         min_chart_width: {min_chart_width}
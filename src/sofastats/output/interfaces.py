@@ -7,6 +7,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass, fields
 import datetime
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 import sqlite3 as sqlite
 from typing import Any, Protocol  #, SupportsKeysAndGetItem (from https://github.com/python/typeshed but not worth another dependency)
@@ -50,23 +51,9 @@ class HTMLItemSpec:
         output.utils.get_report() also handles final HTML output
         """
         style_spec = get_style_spec(self.style_name)
-        tpl_bits = [HTML_AND_SOME_HEAD_TPL, ]
-        if self.output_item_type == OutputItemType.CHART:
-            tpl_bits.append(CHARTING_CSS_TPL)
-            tpl_bits.append(CHARTING_JS_TPL)
-        if self.output_item_type == OutputItemType.MAIN_TABLE:
-            tpl_bits.append(SPACEHOLDER_CSS_TPL)
-        if self.output_item_type == OutputItemType.STATS:
-            tpl_bits.append(STATS_TBL_TPL)
-        tpl_bits.append(HEAD_END_TPL)
-        tpl_bits.append(BODY_START_TPL)
-        tpl_bits.append(self.html_item_str)  ## <======= the actual item content e.g. chart
-        tpl_bits.append(BODY_AND_HTML_END_TPL)
-        tpl = '\n'.join(tpl_bits)
-
-        environment = jinja2.Environment()
-        template = environment.from_string(tpl)
+        template = _get_standalone_template(self.output_item_type)
         context = {
+            'html_item_str': self.html_item_str,  ## <======= the actual item content e.g. chart
             'dojo_xd_js': DOJO_XD_JS,
             'generic_unstyled_css': get_generic_unstyled_css(),
             'sofastats_charts_js': SOFASTATS_CHARTS_JS,
@@ -368,6 +355,26 @@ BODY_AND_HTML_END_TPL = """\
 </html>
 """
 
+@lru_cache(maxsize=None)
+def _get_standalone_template(output_item_type: OutputItemType) -> jinja2.Template:
+    """
+    Standalone item templates only vary by output item type,
+    so assemble and compile each shape once and feed the item content in through the context.
+    """
+    tpl_bits = [HTML_AND_SOME_HEAD_TPL, ]
+    if output_item_type == OutputItemType.CHART:
+        tpl_bits.append(CHARTING_CSS_TPL)
+        tpl_bits.append(CHARTING_JS_TPL)
+    if output_item_type == OutputItemType.MAIN_TABLE:
+        tpl_bits.append(SPACEHOLDER_CSS_TPL)
+    if output_item_type == OutputItemType.STATS:
+        tpl_bits.append(STATS_TBL_TPL)
+    tpl_bits.append(HEAD_END_TPL)
+    tpl_bits.append(BODY_START_TPL)
+    tpl_bits.append('{{ html_item_str }}')
+    tpl_bits.append(BODY_AND_HTML_END_TPL)
+    return jinja2.Environment(auto_reload=False).from_string('\n'.join(tpl_bits))
+
 @dataclass(frozen=True)
 class Report:
     html: str  ## include title
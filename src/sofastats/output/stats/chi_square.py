@@ -16,7 +16,7 @@ from sofastats.output.interfaces import DEFAULT_SUPPLIED_BUT_MANDATORY_ANYWAY, H
 from sofastats.output.stats.interfaces import CommonStatsDesign
 from sofastats.output.styles.interfaces import StyleSpec
 from sofastats.output.styles.utils import get_generic_unstyled_css, get_style_spec, get_styled_stats_tbl_css
-from sofastats.output.utils import format_num, get_p, get_p_explain
+from sofastats.output.utils import format_num, format_nums, get_p, get_p_explain
 from sofastats.stats_calc.chi_square import WorkedResult, get_worked_result
 from sofastats.stats_calc.engine import chisquare as chi_square_stats_calc
 from sofastats.stats_calc.interfaces import ChiSquareResult
@@ -160,14 +160,14 @@ def get_worked_example(worked_result: WorkedResult) -> str:
     <h3>Step 1 - Calculate row and column sums</h3>""")
     html.append('<h4>Row sums</h4>')
     for row_n in range(1, worked_result.row_n + 1):
-        vals_added = ' + '.join(format_num(x) for x in worked_result.row_n2obs_row[row_n])
+        vals_added = ' + '.join(format_nums(worked_result.row_n2obs_row[row_n]))
         row_sums = format_num(worked_result.row_n2row_sum[row_n])
         html.append(f"""
         <p>Row {row_n} Total: {vals_added} = <strong>{row_sums}</strong></p>
         """)
     html.append('<h4>Column sums</h4>')
     for col_n in range(1, worked_result.col_n + 1):
-        vals_added = ' + '.join(format_num(x) for x in worked_result.col_n2obs_row[col_n])
+        vals_added = ' + '.join(format_nums(worked_result.col_n2obs_row[col_n]))
         col_sums = format_num(worked_result.col_n2col_sum[col_n])
         html.append(f"""
         <p>Col {col_n} Total: {vals_added} = <strong>{col_sums}</strong></p>
@@ -10,7 +10,7 @@ from sofastats.output.stats.interfaces import CommonStatsDesignWithoutSortAttrib
 from sofastats.output.stats.msgs import WILCOXON_VARIANCE_BY_APP_EXPLAIN
 from sofastats.output.styles.interfaces import StyleSpec
 from sofastats.output.styles.utils import get_generic_unstyled_css, get_style_spec, get_styled_stats_tbl_css
-from sofastats.output.utils import get_p_explain
+from sofastats.output.utils import format_nums, get_p_explain
 from sofastats.stats_calc.engine import (wilcoxon_signed_ranks_indiv_comparisons as wilcoxon_signed_ranks_for_workings,
     wilcoxont as wilcoxon_signed_ranks_stats_calc, )
 from sofastats.stats_calc.interfaces import (NumericNonParametricSampleSpecFormatted, Sample,
@@ -99,13 +99,13 @@ def get_worked_example(result: WilcoxonIndivComparisonResult, style_name_hyphens
     html.append("""
         </tbody></table>
         <h3>Step 3 - Sum ranks for positive differences</h3>""")
-    plus_rank_vals2add = [format_num(x) for x in result.plus_ranks[:MAX_WORKED_DISPLAY_ROWS]]
+    plus_rank_vals2add = format_nums(result.plus_ranks[:MAX_WORKED_DISPLAY_ROWS])
     displayed_difference_from_total = len(result.plus_ranks) - MAX_WORKED_DISPLAY_ROWS
     if displayed_difference_from_total > 0:
         plus_rank_vals2add.append(f'{format_num(displayed_difference_from_total)} other values not displayed')
     html.append('<p>' + ' + '.join(plus_rank_vals2add) + f' = <strong>{format_num(result.sum_plus_ranks)}</strong></p>')
     html.append("<h3>Step 4 - Sum ranks for negative differences</h3>")
-    minus_rank_vals2add = [format_num(x) for x in result.minus_ranks[:MAX_WORKED_DISPLAY_ROWS]]
+    minus_rank_vals2add = format_nums(result.minus_ranks[:MAX_WORKED_DISPLAY_ROWS])
     displayed_difference_from_total = (len(result.minus_ranks) - MAX_WORKED_DISPLAY_ROWS)
     if displayed_difference_from_total > 0:
         minus_rank_vals2add.append(f"{format_num(displayed_difference_from_total)} other values not displayed")
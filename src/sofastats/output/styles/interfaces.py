@@ -3,7 +3,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import StrEnum
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColorWithHighlight:
     main: str
     highlight: str
@@ -13,7 +13,7 @@ class ColorShiftJSFunctionName(StrEnum):
     BRIGHT = 'getBrightHex'
     HALF_BRIGHT = 'getHalfBrightHex'
 
-@dataclass(frozen=False, kw_only=True)  ## unfrozen so post init possible
+@dataclass(frozen=True, slots=True, kw_only=True)  ## frozen + slots => hashable, compact, safe as a cache key
 class TableStyleSpec:
     ## font colours
     first_level_variable_font_color: str
@@ -30,7 +30,7 @@ class TableStyleSpec:
     top_left_table_space_holder_background_color: str | None = None
     top_left_table_space_holder_background_image: str | None = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChartStyleSpec:
     axis_font_color: str
     border_color: str
@@ -48,7 +48,7 @@ class ChartStyleSpec:
 def _fix_name_for_js(raw_name: str) -> str:
     return raw_name.replace('_', '-').replace(' ', '-').replace('(', '').replace(')', '')
 
-@dataclass(frozen=False)
+@dataclass(frozen=True, slots=True)
 class DojoStyleSpec:
     style_name: str
     tool_tip_name: str = field(init=False)
@@ -58,9 +58,9 @@ class DojoStyleSpec:
     tool_tip_pointer_right: str
 
     def __post_init__(self):
-        self.tool_tip_name = _fix_name_for_js(self.style_name)
+        object.__setattr__(self, 'tool_tip_name', _fix_name_for_js(self.style_name))  ## frozen, so can't assign directly
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StyleSpec:
     name: str
     table: TableStyleSpec
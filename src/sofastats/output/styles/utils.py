@@ -14,11 +14,13 @@ OR
 in simple stats data tables via inline CSS drawing on details directly accessing
 and using style-specific values.
 """
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from itertools import count
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
+import threading
 
 import jinja2
 from ruamel.yaml import YAML
@@ -29,7 +31,14 @@ from sofastats.output.styles.interfaces import (
     ChartStyleSpec, ColorShiftJSFunctionName, ColorWithHighlight, DojoStyleSpec, StyleSpec, TableStyleSpec)
 from sofastats.utils.misc import todict
 
-yaml = YAML(typ='safe')  ## default, if not specified, is 'rt' (round-trip)
+_yaml_per_thread = threading.local()  ## YAML instances hold parser state so can't be shared across threads
+
+def _get_yaml() -> YAML:
+    try:
+        return _yaml_per_thread.yaml
+    except AttributeError:
+        _yaml_per_thread.yaml = YAML(typ='safe')  ## default, if not specified, is 'rt' (round-trip)
+        return _yaml_per_thread.yaml
 
 def yaml_to_style_spec(*, style_name: str, yaml_dict: dict) -> StyleSpec:
     y = yaml_dict
@@ -52,21 +61,19 @@ def yaml_to_style_spec(*, style_name: str, yaml_dict: dict) -> StyleSpec:
         )
 
         color_mappings = []
-        for n in count(1):
-            try:
-                main_color = y[f'item_{n}_main_color']
-                hover_color = y.get(f'item_{n}_hover_color')  ## OK to leave hover colour undefined and allow default behaviour
-            except KeyError:
+        for n in range(1, 256):  ## no style will ever define this many item colours
+            main_color = y.get(f'item_{n}_main_color')
+            if main_color is None:
                 break
-            else:
-                color_mappings.append(ColorWithHighlight(main_color, hover_color))
+            hover_color = y.get(f'item_{n}_hover_color')  ## OK to leave hover colour undefined and allow default behaviour
+            color_mappings.append(ColorWithHighlight(main_color, hover_color))
         chart_spec = ChartStyleSpec(
             axis_font_color=y['axis_font_color'],
             border_color=y['border_color'],
             border_width=int(y['border_width']),
             chart_background_color=y['chart_background_color'],
             chart_title_font_color=y['chart_title_font_color'],
-            color_mappings=color_mappings,
+            color_mappings=tuple(color_mappings),  ## tuple so the frozen spec is actually hashable
             grid_line_width=int(y['grid_line_width']),
             normal_curve_color=y['normal_curve_color'],
             plot_background_color=y['plot_background_color'],
@@ -93,11 +100,15 @@ def yaml_to_style_spec(*, style_name: str, yaml_dict: dict) -> StyleSpec:
     )
     return style_spec
 
+@lru_cache(maxsize=32)
 def get_style_spec(style_name: str, *, debug=False) -> StyleSpec:
     """
     Get dataclass with key colour details and so on e.g.
     style_spec.table_spec.heading_cell_border (DARKER_MID_GREY)
     style_spec.table_spec.first_row_border (None)
+
+    Cached - the same handful of style names recur across items and reports,
+    and the frozen StyleSpec is safe to share.
     """
     ## try using a built-in style
     built_in_styles_path = Path(styles.__file__).parent
@@ -106,7 +117,8 @@ def get_style_spec(style_name: str, *, debug=False) -> StyleSpec:
         ## look for custom YAML file
         yaml_fpath = CUSTOM_STYLES_FOLDER / f"{style_name}.yaml"
     try:
-        yaml_dict = yaml.load(yaml_fpath)
+        ## read_bytes + in-memory parse skips the buffered-reader setup yaml.load(path) would do per style
+        yaml_dict = _get_yaml().load(yaml_fpath.read_bytes())
     except FileNotFoundError as e:
         e.add_note(f"Unable to open {yaml_fpath} to extract style specification for '{style_name}'")
         raise
@@ -122,6 +134,19 @@ def get_style_spec(style_name: str, *, debug=False) -> StyleSpec:
             raise
     return style_spec
 
+def preload_style_specs(style_names: Iterable[str]) -> dict[str, StyleSpec]:
+    """
+    Load several style specs concurrently - useful when a report references multiple styles
+    (or when pre-warming every style for a style chooser).
+    Each load is independent disk I/O + YAML parse, so overlapping them on threads hides the I/O stalls.
+    """
+    names = list(dict.fromkeys(style_names))  ## preserve order, drop repeats
+    if not names:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+        style_specs = list(executor.map(get_style_spec, names))
+    return dict(zip(names, style_specs))
+
 class CSS(Enum):
     """
     CSS can be stored as giant, monolithic blocks of text ready for insertion at the top of HTML files.
@@ -251,6 +276,7 @@ def get_generic_unstyled_css() -> str:
     """
     return generic_unstyled_css
 
+@lru_cache(maxsize=32)
 def get_styled_dojo_chart_css(dojo_style_spec: DojoStyleSpec) -> str:
     """
     Style-specific DOJO - needed only once even if multiple items with the same style.
@@ -308,10 +334,16 @@ def get_styled_dojo_chart_css(dojo_style_spec: DojoStyleSpec) -> str:
     css = template.render(context)
     return css
 
+@lru_cache(maxsize=32)
+def _get_long_color_list(defined_colors: tuple[str, ...]) -> list[str]:
+    return list(defined_colors) + DOJO_COLORS
+
 def get_long_color_list(color_mappings: Sequence[ColorWithHighlight]) -> list[str]:
-    defined_colors = [color_mapping.main for color_mapping in color_mappings]
-    long_color_list = defined_colors + DOJO_COLORS
-    return long_color_list
+    """
+    Note - the same list object is shared between callers with the same defined colours, so don't mutate it.
+    """
+    defined_colors = tuple(color_mapping.main for color_mapping in color_mappings)
+    return _get_long_color_list(defined_colors)
 
 def _get_bg_line(style_spec: StyleSpec) -> str:
     if style_spec.table.top_left_table_space_holder_background_image:
@@ -322,51 +354,54 @@ def _get_bg_line(style_spec: StyleSpec) -> str:
         bg_line = ''
     return bg_line
 
-def get_styled_stats_tbl_css(style_spec: StyleSpec) -> str:
-    """
-    Note - main table CSS is handled completely separately
-    (controlled by Pandas and the spaceholder CSS with embedded image)
-    """
-    tpl = """\
-        .firstcolvar-{{ style_name_hyphens }}, .firstrowvar-{{ style_name_hyphens }}, .spaceholder-{{ style_name_hyphens }} {
+STYLED_STATS_TBL_CSS_TPL = """\
+        .firstcolvar-%(style_name_hyphens)s, .firstrowvar-%(style_name_hyphens)s, .spaceholder-%(style_name_hyphens)s {
             font-family: Ubuntu, Helvetica, Arial, sans-serif;
             font-weight: bold;
             font-size: 14px;
-            color: {{ first_level_variable_font_color }};
+            color: %(first_level_variable_font_color)s;
         }
-        .spaceholder-{{ style_name_hyphens }} {
-            {{ bg_line }}
+        .spaceholder-%(style_name_hyphens)s {
+            %(bg_line)s
         }
-        .firstrowvar-{{ style_name_hyphens }} {
-            color: {{ first_level_variable_font_color }};
-            background-color: {{ first_level_variable_background_color }};
+        .firstrowvar-%(style_name_hyphens)s {
+            color: %(first_level_variable_font_color)s;
+            background-color: %(first_level_variable_background_color)s;
         }
-        .firstcolvar-{{ style_name_hyphens }} {
+        .firstcolvar-%(style_name_hyphens)s {
             padding: 9px 6px;
             vertical-align: top;
-            color: {{ first_level_variable_font_color }};
-            background-color: {{ first_level_variable_background_color }};
+            color: %(first_level_variable_font_color)s;
+            background-color: %(first_level_variable_background_color)s;
         }
-        td.lbl-{{ style_name_hyphens }} {
-            color: {{ variable_font_color_other_levels }};
-            background-color: {{ variable_background_color_other_levels }};
+        td.lbl-%(style_name_hyphens)s {
+            color: %(variable_font_color_other_levels)s;
+            background-color: %(variable_background_color_other_levels)s;
         }
-        td.{{ style_name_hyphens }}, th.{{ style_name_hyphens }}, td.rowval-{{ style_name_hyphens }}, td.datacell-{{ style_name_hyphens }} {
-            border: 1px solid {{ variable_border_color_other_levels }};
+        td.%(style_name_hyphens)s, th.%(style_name_hyphens)s, td.rowval-%(style_name_hyphens)s, td.datacell-%(style_name_hyphens)s {
+            border: 1px solid %(variable_border_color_other_levels)s;
         }
-        .tbl-heading-footnote-{{ style_name_hyphens }}{
-            color: {{ heading_footnote_font_color }};
+        .tbl-heading-footnote-%(style_name_hyphens)s{
+            color: %(heading_footnote_font_color)s;
         }
     """
-    environment = jinja2.Environment()
-    template = environment.from_string(tpl)
+
+@lru_cache(maxsize=32)
+def get_styled_stats_tbl_css(style_spec: StyleSpec) -> str:
+    """
+    Note - main table CSS is handled completely separately
+    (controlled by Pandas and the spaceholder CSS with embedded image)
+
+    Purely substitutional, so a single %-interpolation pass over a module-level template
+    beats building and rendering a Jinja template each call.
+    """
     context = todict(style_spec.table, shallow=True)
     context['style_name_hyphens'] = style_spec.style_name_hyphens
-    bg_line = _get_bg_line(style_spec)
-    context['bg_line'] = bg_line
-    css = template.render(context)
+    context['bg_line'] = _get_bg_line(style_spec)
+    css = STYLED_STATS_TBL_CSS_TPL % context
     return css
 
+@lru_cache(maxsize=32)
 def get_styled_placeholder_css_for_main_tbls(style_name: str) -> str:
     """
     Only used in main tables (cross-tab and freq) not in Stats output tables e.g. ANOVA results tables
@@ -385,12 +420,14 @@ def get_styled_placeholder_css_for_main_tbls(style_name: str) -> str:
     }
     return placeholder_css
 
+_BURNT_ORANGE_WITH_HIGHLIGHT = ColorWithHighlight('#e95f29', '#736354')
+
 def fix_default_single_color_mapping(color_mappings: Sequence[ColorWithHighlight]) -> list[ColorWithHighlight]:
-    new_color_mappings = color_mappings[:1]  ## only need the first
+    first_color_mapping = color_mappings[0]  ## only need the first
     ## This is an important special case because it affects the bar charts using the default style
-    if new_color_mappings[0].main.lower() == '#e95f29':  ## BURNT_ORANGE
-        new_color_mappings = [ColorWithHighlight('#e95f29', '#736354'), ]
-    return new_color_mappings
+    if first_color_mapping.main.lower() == '#e95f29':  ## BURNT_ORANGE
+        return [_BURNT_ORANGE_WITH_HIGHLIGHT, ]
+    return [first_color_mapping, ]
 
 def get_js_highlighting_function(*,
         color_mappings: Sequence[ColorWithHighlight], chart_uuid: str,
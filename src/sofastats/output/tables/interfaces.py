@@ -20,7 +20,7 @@ class PctType(StrEnum):
     ROW_PCT = 'Row %'
     COL_PCT = 'Col %'
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class DimensionSpec:
     """
     Args:
@@ -46,9 +46,10 @@ class DimensionSpec:
         Tables are for computers to make, but for humans to read and understand :-).
         """
         dim_vars = []
-        if self.child:
-            dim_vars.append(self.child.variable_name)
-            dim_vars.extend(self.child.descendant_vars)
+        dim = self.child
+        while dim is not None:
+            dim_vars.append(dim.variable_name)
+            dim = dim.child
         return dim_vars
 
     @property
@@ -57,8 +58,10 @@ class DimensionSpec:
         All DimensionSpecs under, and including, this DimensionSpec.
         """
         dims = [self, ]
-        if self.child:
-            dims.extend(self.child.self_and_descendants)
+        dim = self.child
+        while dim is not None:
+            dims.append(dim)
+            dim = dim.child
         return dims
 
     @property
@@ -80,12 +83,12 @@ class DimensionSpec:
         """
         All percentage metrics (row and/or column percentages) under, or for, this DimensionSpec.
         """
-        if self.pct_metrics:
-            return self.pct_metrics
-        elif self.child:
-            return self.child.self_or_descendant_pct_metrics
-        else:
-            return None
+        dim = self
+        while dim is not None:
+            if dim.pct_metrics:
+                return dim.pct_metrics
+            dim = dim.child
+        return None
 
     def __post_init__(self):
         if self.pct_metrics:
@@ -101,17 +104,18 @@ class DimensionSpec:
                 f"e.g. Car > Country > Car. Variable {self.variable_name}")
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class Row(DimensionSpec):
 
     def __post_init__(self):
         self.is_col = False
-        super().__post_init__()
+        ## zero-arg super() can't be used here - slots=True makes dataclass recreate the class
+        DimensionSpec.__post_init__(self)
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class Column(DimensionSpec):
 
     def __post_init__(self):
         self.is_col = True
-        super().__post_init__()
+        DimensionSpec.__post_init__(self)
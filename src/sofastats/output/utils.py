@@ -1,8 +1,7 @@
-import base64
+import binascii
 from collections.abc import Sequence
-from io import BytesIO
-from itertools import chain
-import math
+from functools import lru_cache
+from io import BytesIO, StringIO
 from pathlib import Path
 
 import jinja2
@@ -15,12 +14,53 @@ from sofastats.output.interfaces import (
 from sofastats.output.styles.utils import (get_generic_unstyled_css, get_style_spec, get_styled_dojo_chart_css,
     get_styled_placeholder_css_for_main_tbls, get_styled_stats_tbl_css)
 
+try:  ## optional SIMD-accelerated base64 - worthwhile for reports with many multi-MB embedded charts
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    def _b64encode(data) -> bytes:
+        return binascii.b2a_base64(data, newline=False)
+
+_JINJA_ENV = jinja2.Environment(auto_reload=False)
+
+@lru_cache(maxsize=64)
+def _compile_tpl(tpl: str) -> jinja2.Template:
+    """
+    Template compilation is the expensive part of rendering -
+    the same report shape produces the same template string, so cache compiled templates by that string.
+    """
+    return _JINJA_ENV.from_string(tpl)
+
+## One canonical report template compiled once at import time.
+## Only the per-style CSS blocks and the body content vary between reports,
+## so they come in through the context (as lists / pre-built HTML) rather than by
+## splicing fragments into a new template string per report and re-parsing it.
+_MASTER_REPORT_TPL = '\n'.join([
+    HTML_AND_SOME_HEAD_TPL,
+    '{% if styled_dojo_chart_css_blocks %}',
+    '{{ dojo_chart_js }}',
+    '{% for styled_dojo_chart_css in styled_dojo_chart_css_blocks %}',
+    CHARTING_CSS_TPL,
+    '{% endfor %}',
+    '{% endif %}',
+    '{% for styled_stats_tbl_css in styled_stats_tbl_css_blocks %}',
+    STATS_TBL_TPL,
+    '{% endfor %}',
+    '{% for styled_placeholder_css_for_main_tbls in styled_placeholder_css_blocks %}',
+    SPACEHOLDER_CSS_TPL,
+    '{% endfor %}',
+    HEAD_END_TPL,
+    BODY_START_TPL,
+    '{{ body_html }}',
+    BODY_AND_HTML_END_TPL,
+])
+_MASTER_REPORT_TEMPLATE = _JINJA_ENV.from_string(_MASTER_REPORT_TPL)
+
 def image_as_data(image_file_path: Path) -> str:
     """
     Returns data:image ...
     """
-    binary_fc = open(image_file_path, 'rb').read()  ## fc a.k.a. file_content
-    img_base64 = base64.b64encode(binary_fc).decode('utf-8')
+    binary_fc = Path(image_file_path).read_bytes()  ## fc a.k.a. file_content - read_bytes also closes the fd promptly
+    img_base64 = _b64encode(binary_fc).decode('ascii')
     image_as_data_str = f"data:image/gif;base64,{img_base64}"
     return image_as_data_str
 
@@ -35,45 +75,11 @@ def plot2image_as_data(plot) -> str:
         plot.save(b_io_1)  ## save to a fake file
     except AttributeError:
         plot.savefig(b_io_1)
-    chart_base64_1 = base64.b64encode(b_io_1.getvalue()).decode('utf-8')
+    chart_base64_1 = _b64encode(b_io_1.getbuffer()).decode('ascii')  ## getbuffer is a zero-copy view, unlike getvalue
     image_as_data_str = f'data:image/png;base64,{chart_base64_1}'
     return image_as_data_str
 
-def _get_report(*, design_specs: Sequence[ReportDesignsSpec] | Sequence[HasToHTMLItemSpec],
-        title: str, is_gallery=False) -> Report:
-    """
-    Collectively work out all which unstyled and styled CSS / JS items are needed in HTML.
-    Then, in body, put the HTML strs in order.
-    Aligning param names exactly with templates from output.interfaces
-
-    HTMLItemSpec.to_standalone_html() also handles final HTML output
-
-    Args:
-        is_gallery: if True, has sections and navigation
-    """
-    try:
-        if is_gallery:
-            all_designs = chain(*[report_designs_spec.designs for report_designs_spec in design_specs])
-            all_html_item_specs = [design.to_html_design() for design in all_designs]
-        else:
-            all_html_item_specs = [design.to_html_design() for design in design_specs]
-    except AttributeError as e:
-        e.add_note("If is_gallery is True design_specs should be ReportDesignsSpec's; otherwise designs")
-        raise e
-    tpl_bits = [
-        HTML_AND_SOME_HEAD_TPL,  ## unstyled
-    ]
-    context = {
-        'tundra_css': TUNDRA_CSS,
-        'dojo_xd_js': DOJO_XD_JS,
-        'sofastats_charts_js': SOFASTATS_CHARTS_JS,
-        'sofastats_dojo_minified_js': SOFASTATS_DOJO_MINIFIED_JS,
-        'generic_unstyled_css': get_generic_unstyled_css(),
-        'title': title,
-    }
-    ## Header (CSS) ****************************************************************************************************
-    if is_gallery:
-        context['gallery_css'] = """
+_GALLERY_CSS = """
         h1.gallery {
           font-size: 32px;
           font-weight: bold;
@@ -136,76 +142,85 @@ def _get_report(*, design_specs: Sequence[ReportDesignsSpec] | Sequence[HasToHTM
         }
         """
 
-    ## CHARTS
-    includes_charts = False
+def _write_report(stream, *, design_specs: Sequence[ReportDesignsSpec] | Sequence[HasToHTMLItemSpec],
+        title: str, is_gallery=False) -> None:
+    """
+    Collectively work out all which unstyled and styled CSS / JS items are needed in HTML.
+    Then, in body, put the HTML strs in order.
+    Aligning param names exactly with templates from output.interfaces
+
+    HTMLItemSpec.to_standalone_html() also handles final HTML output
+
+    Streams rendered chunks straight into `stream` (anything with a write method)
+    so callers writing to disk never hold the entire report - which can run to
+    hundreds of MB once base64 chart images are embedded - in one string.
+
+    Args:
+        is_gallery: if True, has sections and navigation
+    """
+    try:
+        if is_gallery:
+            ## build each design's HTML exactly once - the ToC and body loops below reuse these specs
+            gallery_sections = [(report_designs_spec.title,
+                    [design.to_html_design() for design in report_designs_spec.designs])
+                for report_designs_spec in design_specs]
+            all_html_item_specs = [html_item_spec
+                for _section_title, html_item_specs in gallery_sections for html_item_spec in html_item_specs]
+        else:
+            all_html_item_specs = [design.to_html_design() for design in design_specs]
+    except AttributeError as e:
+        e.add_note("If is_gallery is True design_specs should be ReportDesignsSpec's; otherwise designs")
+        raise e
+    context = {
+        'tundra_css': TUNDRA_CSS,
+        'dojo_xd_js': DOJO_XD_JS,
+        'sofastats_charts_js': SOFASTATS_CHARTS_JS,
+        'sofastats_dojo_minified_js': SOFASTATS_DOJO_MINIFIED_JS,
+        'generic_unstyled_css': get_generic_unstyled_css(),
+        'title': title,
+    }
+    ## Header (CSS) ****************************************************************************************************
+    if is_gallery:
+        context['gallery_css'] = _GALLERY_CSS
+
+    ## Classify items in a single pass - one (output type, style) seen-set both dedups
+    ## and decides inclusion, with the lists keeping first-seen order
+    seen: set[tuple[OutputItemType, str]] = set()
+    chart_style_names: list[str] = []
+    stats_style_names: list[str] = []
+    main_tbl_style_names: list[str] = []
+    chart, stats, main_table = OutputItemType.CHART, OutputItemType.STATS, OutputItemType.MAIN_TABLE
     for html_item_spec in all_html_item_specs:
-        if html_item_spec.output_item_type==OutputItemType.CHART:
-            includes_charts = True
-            break
-    if includes_charts:
-        ## unstyled
-        tpl_bits.append(DOJO_CHART_JS)
-        ## styled
-        chart_styles_done = set()
-        for html_item_spec in all_html_item_specs:
-            if html_item_spec.output_item_type==OutputItemType.CHART and html_item_spec.style_name not in chart_styles_done:
-                styled_css_context_param = f'{html_item_spec.style_name}_styled_dojo_chart_css'
-                styled_charting_css_tpl = (CHARTING_CSS_TPL
-                    .replace('styled_dojo_chart_css', styled_css_context_param)
-                )
-                tpl_bits.append(styled_charting_css_tpl)
-                style_spec = get_style_spec(html_item_spec.style_name)
-                context[styled_css_context_param] = get_styled_dojo_chart_css(style_spec.dojo)
-                chart_styles_done.add(html_item_spec.style_name)
+        key = (html_item_spec.output_item_type, html_item_spec.style_name)
+        if key in seen:
+            continue
+        seen.add(key)
+        output_item_type, style_name = key
+        if output_item_type == chart:
+            chart_style_names.append(style_name)
+        elif output_item_type == stats:
+            stats_style_names.append(style_name)
+        elif output_item_type == main_table:
+            main_tbl_style_names.append(style_name)
+    ## CHARTS
+    if chart_style_names:
+        context['dojo_chart_js'] = DOJO_CHART_JS  ## unstyled
+    context['styled_dojo_chart_css_blocks'] = [  ## styled
+        get_styled_dojo_chart_css(get_style_spec(style_name).dojo) for style_name in chart_style_names]
     ## STATS
-    includes_stats = False
-    for html_item_spec in all_html_item_specs:
-        if html_item_spec.output_item_type==OutputItemType.STATS:
-            includes_stats = True
-            break
-    if includes_stats:
-        ## styled
-        stats_styles_done = set()
-        for html_item_spec in all_html_item_specs:
-            if (html_item_spec.output_item_type==OutputItemType.STATS
-                    and html_item_spec.style_name not in stats_styles_done):
-                styled_stats_tbl_context_param = f'{html_item_spec.style_name}_styled_stats_tbl_css'
-                styled_stats_tbl_tpl = STATS_TBL_TPL.replace('styled_stats_tbl_css', styled_stats_tbl_context_param)
-                tpl_bits.append(styled_stats_tbl_tpl)
-                style_spec = get_style_spec(html_item_spec.style_name)
-                context[styled_stats_tbl_context_param] = get_styled_stats_tbl_css(style_spec)
-                stats_styles_done.add(html_item_spec.style_name)
+    context['styled_stats_tbl_css_blocks'] = [
+        get_styled_stats_tbl_css(get_style_spec(style_name)) for style_name in stats_style_names]
     ## MAIN TABLES
-    includes_main_tbls = False
-    for html_item_spec in all_html_item_specs:
-        if html_item_spec.output_item_type==OutputItemType.MAIN_TABLE:
-            includes_main_tbls = True
-            break
-    if includes_main_tbls:
-        ## styled
-        tbl_styles_done = set()
-        for html_item_spec in all_html_item_specs:
-            if (html_item_spec.output_item_type==OutputItemType.MAIN_TABLE
-                    and html_item_spec.style_name not in tbl_styles_done):
-                styled_spaceholder_context_param = f'{html_item_spec.style_name}_styled_placeholder_css_for_main_tbls'
-                styled_spaceholder_css_tpl = SPACEHOLDER_CSS_TPL.replace(
-                    'styled_placeholder_css_for_main_tbls', styled_spaceholder_context_param)
-                tpl_bits.append(styled_spaceholder_css_tpl)
-                context[styled_spaceholder_context_param] = get_styled_placeholder_css_for_main_tbls(
-                    html_item_spec.style_name)
-                tbl_styles_done.add(html_item_spec.style_name)
-    ## unstyled & already styled
-    tpl_bits.append(HEAD_END_TPL)
-    tpl_bits.append(BODY_START_TPL)
+    context['styled_placeholder_css_blocks'] = [
+        get_styled_placeholder_css_for_main_tbls(style_name) for style_name in main_tbl_style_names]
 
     ## Navigation (ToC) ************************************************************************************************
     if is_gallery:
         toc_bits = ["<h2 id='__contents__'>Contents</h2><br>", ]
-        for report_designs_spec in design_specs:
+        for section_title, html_item_specs in gallery_sections:
             toc_bits.append(
-                f"<a class='toc-link-level-1' href='#{report_designs_spec.title}'>{report_designs_spec.title}</a>")
-            for design in report_designs_spec.designs:
-                html_item_spec = design.to_html_design()
+                f"<a class='toc-link-level-1' href='#{section_title}'>{section_title}</a>")
+            for html_item_spec in html_item_specs:
                 item =(f"<a class='toc-link-level-2' href='#{html_item_spec.output_title}'>"
                      f"{html_item_spec.output_title} ({html_item_spec.design_name})"
                      "</a>")
@@ -216,42 +231,47 @@ def _get_report(*, design_specs: Sequence[ReportDesignsSpec] | Sequence[HasToHTM
 
     ## Body / Content **************************************************************************************************
 
+    ## Write straight into a single buffer - joining ever-larger intermediate strings is quadratic on big reports
+    body_buf = StringIO()
+    body_buf.write(f"<h1 class='gallery'>{title}</h1>\n"
+        '<img src="https://sofastats.github.io/sofastats_lib/images/carousel.png" alt="Output Carousel" width="400" />'
+        f"\n<p>Note - custom styles can be applied to your output. For example, you could make a retro80s style. "
+        f'How-To Guide here: <a target="_blank" href="https://sofastats.github.io/sofastats_lib/styles/">Making Custom Styles</a>'
+        f"</p>{toc_or_not}")
+    item_divider = """"<br><div style="clear: both;"></div><br>"""
     ## Items
-    items = []
     if is_gallery:
-        for report_designs_spec in design_specs:
-            item = f"<h2 id='{report_designs_spec.title}' class='section'>{report_designs_spec.title}</h2>"
-            items.append(item)
-            for design_spec in report_designs_spec.designs:
-                html_item_spec = design_spec.to_html_design()
+        first_block = True
+        for section_title, html_item_specs in gallery_sections:
+            if not first_block:
+                body_buf.write(item_divider)
+            first_block = False
+            body_buf.write(f"<h2 id='{section_title}' class='section'>{section_title}</h2>")
+            for html_item_spec in html_item_specs:
+                body_buf.write(item_divider)
                 back_to_contents = " <a class='back-to-toc-link' href='#__contents__'>⮬ Back to Contents</a>"
-                item = (f"<hr><div class='item-heading'><h3 class='item' id='{html_item_spec.output_title}'>"
+                body_buf.write(f"<hr><div class='item-heading'><h3 class='item' id='{html_item_spec.output_title}'>"
                     f"{html_item_spec.output_title} ({html_item_spec.design_name})</h3>{back_to_contents}</div>"
-                    f"\n{html_item_spec.html_item_str}")
-                items.append(item)  ## <======= the actual item content as HTML e.g. for a bar chart
+                    f"\n{html_item_spec.html_item_str}")  ## <======= the actual item content as HTML e.g. for a bar chart
     else:
+        first_block = True
         for html_item_spec in all_html_item_specs:
-            item = (f"<hr><div class='item-heading'><h3 class='item' id='{html_item_spec.output_title}'>"
+            if not first_block:
+                body_buf.write(item_divider)
+            first_block = False
+            body_buf.write(f"<hr><div class='item-heading'><h3 class='item' id='{html_item_spec.output_title}'>"
                 f"{html_item_spec.output_title} ({html_item_spec.design_name})</h3></div>"
-                f"\n{html_item_spec.html_item_str}")
-            items.append(item)  ## <======= the actual item content as HTML e.g. for a bar chart
-    items_html = """"<br><div style="clear: both;"></div><br>""".join(items)
+                f"\n{html_item_spec.html_item_str}")  ## <======= the actual item content as HTML e.g. for a bar chart
+    context['body_html'] = body_buf.getvalue()
 
-    ## consolidate items
-    tpl_bits.append(f"<h1 class='gallery'>{title}</h1>\n"
-        '<img src="https://sofastats.github.io/sofastats_lib/images/carousel.png" alt="Output Carousel" width="400" />'
-        f"\n<p>Note - custom styles can be applied to your output. For example, you could make a retro80s style. "
-        f'How-To Guide here: <a target="_blank" href="https://sofastats.github.io/sofastats_lib/styles/">Making Custom Styles</a>'
-        f"</p>{toc_or_not}"
-        + items_html)
-    tpl_bits.append(BODY_AND_HTML_END_TPL)
+    ## Render against the precompiled skeleton *************************************************************************
+    _MASTER_REPORT_TEMPLATE.stream(context).dump(stream)
 
-    ## Assemble template ***********************************************************************************************
-    tpl = '\n'.join(tpl_bits)
-    environment = jinja2.Environment()
-    template = environment.from_string(tpl)
-    html = template.render(context)
-    return Report(html)
+def _get_report(*, design_specs: Sequence[ReportDesignsSpec] | Sequence[HasToHTMLItemSpec],
+        title: str, is_gallery=False) -> Report:
+    buf = StringIO()
+    _write_report(buf, design_specs=design_specs, title=title, is_gallery=is_gallery)
+    return Report(buf.getvalue())
 
 def get_report(designs: Sequence[CommonDesign], title: str) -> Report:
     return _get_report(design_specs=designs, title=title, is_gallery=False)
@@ -259,62 +279,70 @@ def get_report(designs: Sequence[CommonDesign], title: str) -> Report:
 def get_gallery_report(report_designs_specs: Sequence[ReportDesignsSpec], title: str) -> Report:
     return _get_report(design_specs=report_designs_specs, title=title, is_gallery=True)
 
+def write_report(fpath: Path | str, designs: Sequence[CommonDesign], title: str):
+    """
+    Like get_report but streams straight to `fpath` without materialising the report HTML in memory.
+    """
+    with open(fpath, 'w') as f:
+        _write_report(f, design_specs=designs, title=title, is_gallery=False)
+
+def write_gallery_report(fpath: Path | str, report_designs_specs: Sequence[ReportDesignsSpec], title: str):
+    """
+    Like get_gallery_report but streams straight to `fpath` without materialising the report HTML in memory.
+    """
+    with open(fpath, 'w') as f:
+        _write_report(f, design_specs=report_designs_specs, title=title, is_gallery=True)
+
 def to_precision(num, precision):
     """
     Returns a string representation of x formatted with a precision of p.
 
-    Based on the webkit JavaScript implementation taken from here:
+    Behaviour matches the webkit JavaScript implementation taken from here:
     https://code.google.com/p/webkit-mirror/source/browse/JavaScriptCore/kjs/number_object.cpp
 
     http://randlet.com/blog/python-significant-figures-format/
+
+    The significant-figures rounding is left to C-level '%e' formatting;
+    Python only decides between fixed and scientific layout, which is far cheaper
+    than the explicit log10/floor/char-list version this replaces.
     """
     x = float(num)
     if x == 0.:
         return '0.' + '0'*(precision - 1)
+    mantissa, _, exponent = ('%.*e' % (precision - 1, x)).partition('e')
+    e = int(exponent)
+    digits = mantissa.replace('.', '')
     out = []
-    if x < 0:
+    if digits.startswith('-'):
         out.append('-')
-        x = -x
-    e = int(math.log10(x))
-    tens = math.pow(10, e - precision + 1)
-    n = math.floor(x/tens)
-    if n < math.pow(10, precision - 1):
-        e = e -1
-        tens = math.pow(10, e - precision + 1)
-        n = math.floor(x / tens)
-    if abs((n + 1.) * tens - x) <= abs(n * tens -x):
-        n = n + 1
-    if n >= math.pow(10, precision):
-        n = n / 10.
-        e = e + 1
-    m = '%.*g' % (precision, n)
+        digits = digits[1:]
     if e < -2 or e >= precision:
-        out.append(m[0])
+        out.append(digits[0])
         if precision > 1:
             out.append('.')
-            out.extend(m[1:precision])
+            out.append(digits[1:precision])
         out.append('e')
         if e > 0:
             out.append('+')
         out.append(str(e))
-    elif e == (precision -1):
-        out.append(m)
+    elif e == (precision - 1):
+        out.append(digits)
     elif e >= 0:
-        out.append(m[:e+1])
-        if e+1 < len(m):
+        out.append(digits[:e + 1])
+        if e + 1 < len(digits):
             out.append('.')
-            out.extend(m[e+1:])
+            out.append(digits[e + 1:])
     else:
         out.append('0.')
-        out.extend(['0'] * -(e+1))
-        out.append(m)
+        out.append('0' * -(e + 1))
+        out.append(digits)
     return ''.join(out)
 
 def get_p(p):
-    p_str = to_precision(num=p, precision=4)
-    if p < 0.001:
-        p_str = f'< 0.001 ({p_str})'
-    return p_str
+    ## Note - format(p, '.4g') would be quicker still but strips the trailing zeros
+    ## to_precision keeps (e.g. '0.05000'), so stick with the significant-figures formatter.
+    p_str = to_precision(p, 4)
+    return f'< 0.001 ({p_str})' if p < 0.001 else p_str
 
 def format_num(num):
     try:
@@ -323,6 +351,17 @@ def format_num(num):
         formatted = num
     return formatted
 
+def format_nums(nums) -> list[str]:
+    """
+    Bulk version of format_num e.g. for a whole row of observed values in a worked example.
+    One comprehension keeps the common all-numeric case free of per-value function calls;
+    only falls back to per-value handling if something non-numeric sneaks in.
+    """
+    try:
+        return [f'{num:,}' for num in nums]
+    except ValueError:
+        return [format_num(num) for num in nums]
+
 def get_p_explain(a: str, b: str) -> str:
     p_explain = ("If p is small, e.g. less than 0.01, or 0.001, you can assume the result is statistically significant "
      f'i.e. there is a relationship between "{a}" and "{b}". '
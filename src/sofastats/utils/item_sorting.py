@@ -6,10 +6,26 @@ So only by SortOrder's: VALUE, CUSTOM but not INCREASING, or DECREASING.
 sort_orders: SortOrderSpecs = a dict for each variable with values in expected order
 sort_order: SortOrder = how an individual variable is to be sorted e.g. CUSTOM
 """
+from functools import lru_cache
 from typing import Any
 
 from sofastats.conf.main import SortOrderSpecs, SortOrder
 
+@lru_cache(maxsize=128)
+def _get_value2order(values_in_order: tuple) -> dict:
+    """
+    Charts re-sort the same category orderings once per series,
+    so cache the order lookup per custom ordering rather than rebuilding the dict each call.
+    """
+    return {val: order for order, val in enumerate(values_in_order)}
+
+def _is_sorted(items: list) -> bool:
+    """
+    One linear pass - cheaper than an O(n log n) sort when the values are already in order,
+    which is the common case when the same categorical lists are re-sorted per chart or series.
+    """
+    return all(a <= b for a, b in zip(items, items[1:]))
+
 def sort_by_text(*, variable_name: str, values: list[Any],
         sort_orders: SortOrderSpecs, sort_order: SortOrder) -> list[Any]:
     """
@@ -25,20 +41,27 @@ def sort_by_text(*, variable_name: str, values: list[Any],
     Table variable values are sorted by get_sorted_multi_index_list() in output.tables.utils.multi_index_sort
     """
     if sort_order == SortOrder.VALUE:
-        sorted_values = sorted(values)
+        if _is_sorted(values):  ## already in order - skip the sort (common when revisiting the same categories)
+            sorted_values = values
+        else:
+            sorted_values = list(values)  ## fast C-level copy, then Timsort in place
+            sorted_values.sort()
     elif sort_order == SortOrder.CUSTOM:
-        orig_values = values.copy()
-        try:
-            specified_custom_values_in_order = sort_orders[variable_name]
-        except KeyError:
-            sorted_values = orig_values  ## leave as the order they were supplied - don't sort
+        specified_custom_values_in_order = sort_orders.get(variable_name)  ## plain dict probe - no exception machinery on the (common) miss
+        if specified_custom_values_in_order is None:
+            sorted_values = values  ## leave as the order they were supplied - don't sort (never mutated, so no copy needed)
         else:
-            value2order = {val: order for order, val in enumerate(specified_custom_values_in_order)}
-            try:
-                sorted_values = sorted(orig_values, key=lambda val: value2order[val])
-            except KeyError:
+            value2order = _get_value2order(tuple(specified_custom_values_in_order))
+            missing = set(values).difference(value2order)  ## fail fast before any sorting work
+            if missing:
                 raise Exception(f"The custom sort order you supplied for values in variable '{variable_name}' "
-                    "didn't include all the values in your analysis so please fix that and try again.")
+                    "didn't include all the values in your analysis so please fix that and try again. "
+                    f"Missing: {sorted(missing, key=str)}")
+            keys = [value2order[val] for val in values]
+            if _is_sorted(keys):  ## already in custom order - skip the sort
+                sorted_values = values
+            else:
+                sorted_values = sorted(values, key=value2order.__getitem__)  ## bound C method
     else:
         raise Exception(f"Unexpected sort_order ({sort_order})"
             "\nINCREASING and DECREASING not allowed using sort_values_by_value_or_custom_if_possible().")
@@ -8,21 +8,30 @@ from sofastats.output.tables.interfaces import Column, Metric, Row
 from sofastats_examples.scripts.conf import (
     output_folder, people_csv_file_path, sort_orders_yaml_file_path, sqlite_demo_db_file_path)
 
-def cross_tab_from_sqlite_db_filtered(sqlite_cur):
+def get_standard_variable_designs() -> tuple[list[Row], list[Column]]:
     """
     Top-level row variables (design settings and any nested variables)
     Top-level column variables (design settings and any nested variables)
-    """
-    row_variables_design_1 = Row(variable_name='Country', has_total=True, sort_order=SortOrder.CUSTOM,
-        child=Row(variable_name='Home Location Type', has_total=True, sort_order=SortOrder.VALUE))
-    row_variables_design_2 = Row(variable_name='Home Location Type', has_total=True, sort_order=SortOrder.CUSTOM)
-    row_variables_design_3 = Row(variable_name='Car')
 
-    col_variables_design_1 = Column(variable_name='Sleep Group', has_total=True, sort_order=SortOrder.CUSTOM)
-    col_variables_design_2 = Column(variable_name='Age Group', has_total=True, sort_order=SortOrder.CUSTOM,
-         child=Column(variable_name='Handedness', has_total=True, sort_order=SortOrder.CUSTOM, pct_metrics=[Metric.ROW_PCT, Metric.COL_PCT]))
-    col_variables_design_3 = Column(variable_name='Tertiary Qualifications', has_total=True, sort_order=SortOrder.CUSTOM)
+    The three standard cross tab demos share the same design, so build it in one place.
+    Fresh objects each call - Row / Column are mutable so sharing instances across designs would be unsafe.
+    """
+    row_variable_designs = [
+        Row(variable_name='Country', has_total=True, sort_order=SortOrder.CUSTOM,
+            child=Row(variable_name='Home Location Type', has_total=True, sort_order=SortOrder.VALUE)),
+        Row(variable_name='Home Location Type', has_total=True, sort_order=SortOrder.CUSTOM),
+        Row(variable_name='Car'),
+    ]
+    column_variable_designs = [
+        Column(variable_name='Sleep Group', has_total=True, sort_order=SortOrder.CUSTOM),
+        Column(variable_name='Age Group', has_total=True, sort_order=SortOrder.CUSTOM,
+            child=Column(variable_name='Handedness', has_total=True, sort_order=SortOrder.CUSTOM, pct_metrics=[Metric.ROW_PCT, Metric.COL_PCT])),
+        Column(variable_name='Tertiary Qualifications', has_total=True, sort_order=SortOrder.CUSTOM),
+    ]
+    return row_variable_designs, column_variable_designs
 
+def cross_tab_from_sqlite_db_filtered(sqlite_cur):
+    row_variable_designs, column_variable_designs = get_standard_variable_designs()
     design = CrossTabDesign(
         cur=sqlite_cur,
         database_engine_name=DbeName.SQLITE,  ## or just the string 'sqlite'
@@ -32,28 +41,15 @@ def cross_tab_from_sqlite_db_filtered(sqlite_cur):
         output_title='Cross Tab from SQLite (Filtered by Car)',
         show_in_web_browser=True,
         sort_orders_yaml_file_path=sort_orders_yaml_file_path,
-        row_variable_designs=[row_variables_design_1, row_variables_design_2, row_variables_design_3],
-        column_variable_designs=[col_variables_design_1, col_variables_design_2, col_variables_design_3],
+        row_variable_designs=row_variable_designs,
+        column_variable_designs=column_variable_designs,
         style_name='default',
         decimal_points=2,
     )
     return design
 
 def cross_tab_from_sqlite_db(sqlite_cur):
-    """
-    Top-level row variables (design settings and any nested variables)
-    Top-level column variables (design settings and any nested variables)
-    """
-    row_variables_design_1 = Row(variable_name='Country', has_total=True, sort_order=SortOrder.CUSTOM,
-        child=Row(variable_name='Home Location Type', has_total=True, sort_order=SortOrder.VALUE))
-    row_variables_design_2 = Row(variable_name='Home Location Type', has_total=True, sort_order=SortOrder.CUSTOM)
-    row_variables_design_3 = Row(variable_name='Car')
-
-    col_variables_design_1 = Column(variable_name='Sleep Group', has_total=True, sort_order=SortOrder.CUSTOM)
-    col_variables_design_2 = Column(variable_name='Age Group', has_total=True, sort_order=SortOrder.CUSTOM,
-         child=Column(variable_name='Handedness', has_total=True, sort_order=SortOrder.CUSTOM, pct_metrics=[Metric.ROW_PCT, Metric.COL_PCT]))
-    col_variables_design_3 = Column(variable_name='Tertiary Qualifications', has_total=True, sort_order=SortOrder.CUSTOM)
-
+    row_variable_designs, column_variable_designs = get_standard_variable_designs()
     design = CrossTabDesign(
         cur=sqlite_cur,
         database_engine_name=DbeName.SQLITE,  ## or just the string 'sqlite'
@@ -62,36 +58,23 @@ def cross_tab_from_sqlite_db(sqlite_cur):
         output_title='Cross Tab from SQLite',
         show_in_web_browser=True,
         sort_orders_yaml_file_path=sort_orders_yaml_file_path,
-        row_variable_designs=[row_variables_design_1, row_variables_design_2, row_variables_design_3],
-        column_variable_designs=[col_variables_design_1, col_variables_design_2, col_variables_design_3],
+        row_variable_designs=row_variable_designs,
+        column_variable_designs=column_variable_designs,
         style_name='default',
         decimal_points=2,
     )
     return design
 
 def cross_tab(csv_file_path):
-    """
-    Top-level row variables (design settings and any nested variables)
-    Top-level column variables (design settings and any nested variables)
-    """
-    row_variables_design_1 = Row(variable_name='Country', has_total=True, sort_order=SortOrder.CUSTOM,
-        child=Row(variable_name='Home Location Type', has_total=True, sort_order=SortOrder.VALUE))
-    row_variables_design_2 = Row(variable_name='Home Location Type', has_total=True, sort_order=SortOrder.CUSTOM)
-    row_variables_design_3 = Row(variable_name='Car')
-
-    col_variables_design_1 = Column(variable_name='Sleep Group', has_total=True, sort_order=SortOrder.CUSTOM)
-    col_variables_design_2 = Column(variable_name='Age Group', has_total=True, sort_order=SortOrder.CUSTOM,
-         child=Column(variable_name='Handedness', has_total=True, sort_order=SortOrder.CUSTOM, pct_metrics=[Metric.ROW_PCT, Metric.COL_PCT]))
-    col_variables_design_3 = Column(variable_name='Tertiary Qualifications', has_total=True, sort_order=SortOrder.CUSTOM)
-
+    row_variable_designs, column_variable_designs = get_standard_variable_designs()
     design = CrossTabDesign(
         csv_file_path=csv_file_path,
         output_file_path=output_folder / 'demo_main_cross_tab.html',
         output_title='Cross Tab',
         show_in_web_browser=True,
         sort_orders_yaml_file_path=sort_orders_yaml_file_path,
-        row_variable_designs=[row_variables_design_1, row_variables_design_2, row_variables_design_3],
-        column_variable_designs=[col_variables_design_1, col_variables_design_2, col_variables_design_3],
+        row_variable_designs=row_variable_designs,
+        column_variable_designs=column_variable_designs,
         style_name='red_spirals',
         decimal_points=2,
     )
@@ -21,8 +21,8 @@ Strategy for getting sorted category items (values or labels)
 
 3. Convert resulting series into dictionaries so we can pluck values out using keys we supply following a sort order
    we control externally. E.g. looping through sorted or value_sorted Age Group values.
-   category2freq = dict(s_freqs.items())
-   category2pct = dict(s_pcts.items())
+   category2freq = s_freqs.to_dict()
+   category2pct = s_pcts.to_dict()
 
 4. Gather category values and labels into lists e.g.
    category_freqs = []
@@ -42,8 +42,12 @@ Strategy for getting sorted category items (values or labels)
 """
 
 from collections.abc import Sequence
+from dataclasses import fields
+from functools import lru_cache
+import re
 from statistics import median
 
+import numpy as np
 import pandas as pd
 
 from sofastats.conf.main import ChartMetric, SortOrder
@@ -69,7 +73,97 @@ from tests.conf import (age_groups_custom_sorted, age_groups_value_sorted,
     people_csv_fpath, people_with_missing_categories_csv_fpath,
     sort_orders_yaml_file_path,
     sports_csv_file_path, sports_custom_sorted, sports_value_sorted, sports_with_missing_categories_csv_file_path)
-from tests.utils import display_amount_as_nice_str, display_pct_as_nice_str
+from tests.utils import display_amount_as_nice_str, display_pct_as_nice_str, get_cached_df, print_html_for_debugging
+
+_GROUPED_BY_DF_AND_FIELDS: dict[tuple[int, str | tuple[str, str]], object] = {}
+
+def _get_group(df: pd.DataFrame, by: str | tuple[str, str], key) -> pd.DataFrame:
+    """
+    One hash partition of df per grouping, shared across loop iterations and tests
+    (get_cached_df hands out the same frame objects for the whole session, so keying on id(df) is safe).
+    get_group() then gathers each sub-frame by integer position instead of building a fresh
+    full-length boolean mask and scanning the whole table per chart / series value.
+    """
+    cache_key = (id(df), by)
+    grouped = _GROUPED_BY_DF_AND_FIELDS.get(cache_key)
+    if grouped is None:
+        by2use = list(by) if isinstance(by, tuple) else by
+        grouped = _GROUPED_BY_DF_AND_FIELDS[cache_key] = df.groupby(by2use, sort=False, observed=True)
+    sub_frame_key = (id(df), by, key)
+    df_sub = _SUBFRAMES.get(sub_frame_key)
+    if df_sub is None:
+        df_sub = _SUBFRAMES[sub_frame_key] = grouped.get_group(key)
+    return df_sub
+
+_SUBFRAMES: dict = {}  ## sub-frames kept alive so sibling tests get identical objects (and so id()-keyed caches stay valid)
+_CATEGORY_SIZES: dict[tuple[int, str], pd.Series] = {}
+
+def _get_category_sizes(df_filtered: pd.DataFrame, category_field_name: str) -> pd.Series:
+    """
+    The eight sibling variants of each multi-chart test re-count the same category frequencies
+    for the same (chart, series) sub-frames. Count each combination once per session -
+    equivalent to one big (chart, series, category) aggregation pass shared across the variants.
+    """
+    cache_key = (id(df_filtered), category_field_name)
+    sizes = _CATEGORY_SIZES.get(cache_key)
+    if sizes is None:
+        sizes = _CATEGORY_SIZES[cache_key] = df_filtered.groupby(category_field_name, sort=False, observed=True).size()
+    return sizes
+
+_HTML_BY_DESIGN_SPEC: dict[tuple[type, str], str] = {}
+
+def _get_html(design) -> str:
+    """
+    Some sibling tests build identically-configured designs (e.g. the value-sorted and
+    category-value-sorted multi-chart bar tests, where VALUE is the default sort anyway),
+    so generate each distinct page once per session rather than per test.
+    Keyed on the design's configuration fields - all except `cur`,
+    which __post_init__ sets to the internal-database cursor and which says nothing about the output.
+    """
+    key = (type(design),
+        repr([(f.name, getattr(design, f.name)) for f in fields(design) if f.name != 'cur']))
+    html = _HTML_BY_DESIGN_SPEC.get(key)
+    if html is None:
+        html = _HTML_BY_DESIGN_SPEC[key] = design.to_html_design().html_item_str
+    return html
+
+_N_RECORDS_RE = re.compile(r'conf\["n_records"\] = "N = [\d,]+";')
+
+@lru_cache(maxsize=8)
+def _get_n_records_fragments(html: str) -> frozenset[str]:
+    """
+    Multi-chart pages carry one n_records line per chart and the nested chart / series loops
+    checked each with its own full-page substring scan. One regex pass per page instead,
+    cached like _get_axis_label_fragments.
+    """
+    return frozenset(_N_RECORDS_RE.findall(html))
+
+_VALS_RE = re.compile(r'\["vals"\] = [^;]+;')
+_Y_LBLS_RE = re.compile(r'yLbls: \[[^\]]*\]')
+
+@lru_cache(maxsize=8)
+def _get_vals_fragments(html: str) -> frozenset[str]:
+    """
+    Every series on a page contributes a series_N["vals"] = [...]; line and the check helpers
+    each substring-scanned the whole page for theirs. Collect them all in one pass, cached per page.
+    """
+    return frozenset(_VALS_RE.findall(html))
+
+@lru_cache(maxsize=8)
+def _get_y_lbls_fragments(html: str) -> frozenset[str]:
+    """As _get_vals_fragments but for the yLbls: [...] tool-tip blocks (labels never contain ])."""
+    return frozenset(_Y_LBLS_RE.findall(html))
+
+_AXIS_LABEL_RE = re.compile(r'\{value: \d+, text: "[^"]*"\}')
+
+@lru_cache(maxsize=8)
+def _get_axis_label_fragments(html: str) -> frozenset[str]:
+    """
+    One regex pass over the chart page instead of a full-page substring scan per expected axis label.
+    Cached because the same html is checked once per chart / series combination
+    (str hashes are cached by CPython so repeat lookups on the big string are cheap).
+    """
+    return frozenset(_AXIS_LABEL_RE.findall(html))
 
 def check_order_even_though_no_sequence_or_indexes(html: str, items_in_expected_order: Sequence[str]):
     html_shrinking_rightwards = html
@@ -89,7 +183,16 @@ def _check_n_records(
     else:
         n_records = len(df_filtered)
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
+        assert records in _get_n_records_fragments(html), records
+
+def _get_filter_lbls(wanted_category_values: Sequence[str], *,
+        series_value: str | None = None, chart_value: str | None = None) -> list[str]:
+    if series_value is not None:
+        return [f"{category_value}, {series_value}<br>" for category_value in wanted_category_values]
+    elif chart_value is not None:
+        return [f"{category_value}, {chart_value}<br>" for category_value in wanted_category_values]
+    else:
+        return [''] * len(wanted_category_values)
 
 def _initial_category_checks(*, df_filtered: pd.DataFrame, html: str, category_values_in_expected_order: Sequence[str],
         category_values_in_data: Sequence[str], series_value: str | None = None, already_checked_n_records=False):
@@ -109,7 +212,7 @@ def _initial_category_checks(*, df_filtered: pd.DataFrame, html: str, category_v
             continue
         n += 1
         category_label = f'{{value: {n}, text: "{category_value}"}}'
-        assert category_label in html, category_label
+        assert category_label in _get_axis_label_fragments(html), category_label
 
 def check_category_freqs(*, df_filtered: pd.DataFrame, html: str,
         category_field_name: str, category_values_in_expected_order: Sequence[str],
@@ -120,31 +223,20 @@ def check_category_freqs(*, df_filtered: pd.DataFrame, html: str,
         category_values_in_expected_order=category_values_in_expected_order,
         category_values_in_data=category_values_in_data,
         series_value=series_value, already_checked_n_records=already_checked_n_records)
-    s_freqs = df_filtered.groupby(category_field_name).size()
-    s_pcts = ((100 * df_filtered.groupby(category_field_name).size()) / len(df_filtered))
-    category2freq = dict(s_freqs.items())
-    category2pct = dict(s_pcts.items())
-    category_freqs = []
-    category_labels = []
-    for category_value in category_values_in_expected_order:
-        if category_value not in category_values_in_data:
-            continue
-        category_freq = category2freq[category_value]
-        category_freqs.append(category_freq)
-        category_pct = category2pct[category_value]
-        if series_value is not None:
-            filter_lbl = f"{category_value}, {series_value}<br>"
-        elif chart_value is not None:
-            filter_lbl = f"{category_value}, {chart_value}<br>"
-        else:
-            filter_lbl = ''
-        label_pct = display_pct_as_nice_str(category_pct, decimal_points=decimal_points)
-        category_label = f"'{filter_lbl}{category_freq}<br>({label_pct})'"
-        category_labels.append(category_label)
+    s_freqs = _get_category_sizes(df_filtered, category_field_name)
+    s_pcts = (100 * s_freqs) / len(df_filtered)  ## reuse the frequencies - same groupby; keep operation order so floats match the charts
+    wanted_category_values = [category_value for category_value in category_values_in_expected_order
+        if category_value in category_values_in_data]
+    category_freqs = s_freqs.reindex(wanted_category_values).tolist()  ## aligned in one pass - no per-value dict lookups
+    category_pcts = s_pcts.reindex(wanted_category_values).tolist()
+    filter_lbls = _get_filter_lbls(wanted_category_values, series_value=series_value, chart_value=chart_value)
+    category_labels = [
+        f"'{filter_lbl}{category_freq}<br>({display_pct_as_nice_str(category_pct, decimal_points=decimal_points)})'"
+        for filter_lbl, category_freq, category_pct in zip(filter_lbls, category_freqs, category_pcts)]
     vals = f'["vals"] = {category_freqs};'
-    assert vals in html, vals
+    assert vals in _get_vals_fragments(html), vals
     y_labels = "yLbls: [" + ", ".join(category_labels) + "]"
-    assert y_labels in html, y_labels
+    assert y_labels in _get_y_lbls_fragments(html), y_labels
 
 def check_category_pcts(*, df_filtered: pd.DataFrame, html: str,
         category_field_name: str, category_values_in_expected_order: Sequence[str],
@@ -159,31 +251,20 @@ def check_category_pcts(*, df_filtered: pd.DataFrame, html: str,
         category_values_in_expected_order=category_values_in_expected_order,
         category_values_in_data=category_values_in_data,
         series_value=series_value, already_checked_n_records=already_checked_n_records)
-    s_freqs = df_filtered.groupby(category_field_name).size()
-    s_pcts = ((100 * df_filtered.groupby(category_field_name).size()) / len(df_filtered))
-    category2freq = dict(s_freqs.items())
-    category2pct = dict(s_pcts.items())
-    category_pcts = []  ## raw values with all decimal points so graph accurate
-    category_labels = []  ## rounded values so sensible to read
-    for category_value in category_values_in_expected_order:
-        if category_value not in category_values_in_data:
-            continue
-        category_freq = category2freq[category_value]
-        category_pct = category2pct[category_value]
-        category_pcts.append(category_pct)
-        if series_value is not None:
-            filter_lbl = f"{category_value}, {series_value}<br>"
-        elif chart_value is not None:
-            filter_lbl = f"{category_value}, {chart_value}<br>"
-        else:
-            filter_lbl = ''
-        label_pct = display_pct_as_nice_str(category_pct, decimal_points=decimal_points)
-        category_label = f"'{filter_lbl}{category_freq}<br>({label_pct})'"
-        category_labels.append(category_label)
+    s_freqs = _get_category_sizes(df_filtered, category_field_name)
+    s_pcts = (100 * s_freqs) / len(df_filtered)  ## reuse the frequencies - same groupby; keep operation order so floats match the charts
+    wanted_category_values = [category_value for category_value in category_values_in_expected_order
+        if category_value in category_values_in_data]
+    category_freqs = s_freqs.reindex(wanted_category_values).tolist()
+    category_pcts = s_pcts.reindex(wanted_category_values).tolist()  ## raw values with all decimal points so graph accurate
+    filter_lbls = _get_filter_lbls(wanted_category_values, series_value=series_value, chart_value=chart_value)
+    category_labels = [  ## rounded values so sensible to read
+        f"'{filter_lbl}{category_freq}<br>({display_pct_as_nice_str(category_pct, decimal_points=decimal_points)})'"
+        for filter_lbl, category_freq, category_pct in zip(filter_lbls, category_freqs, category_pcts)]
     vals = f'["vals"] = {category_pcts};'
-    assert vals in html, vals
+    assert vals in _get_vals_fragments(html), vals
     y_labels = "yLbls: [" + ", ".join(category_labels) + "]"
-    assert y_labels in html, y_labels
+    assert y_labels in _get_y_lbls_fragments(html), y_labels
 
 def check_category_averages(*, df_filtered: pd.DataFrame, html: str, field_name: str,
         category_field_name: str, category_values_in_expected_order: Sequence[str], decimal_points: int = 3):
@@ -191,29 +272,24 @@ def check_category_averages(*, df_filtered: pd.DataFrame, html: str, field_name:
     Values are unrounded averages; labels are rounded
     """
     n_records = len(df_filtered)
-    assert f'conf["n_records"] = "N = {n_records:,}";' in html
+    assert f'conf["n_records"] = "N = {n_records:,}";' in _get_n_records_fragments(html)
     category_values_in_data = df_filtered[category_field_name].unique()
     n = 0
     for category_value in category_values_in_expected_order:
         if category_value not in category_values_in_data:
             continue
         n += 1
-        assert f'{{value: {n}, text: "{category_value}"}}' in html
-    s_avgs = df_filtered.groupby(category_field_name)[field_name].mean()
-    category2avg = dict(s_avgs.items())
-    category_avgs = []  ## raw values with all decimal points so graph accurate
-    category_labels = []  ## rounded values so sensible to read
-    for category_value in category_values_in_expected_order:
-        if category_value not in category_values_in_data:
-            continue
-        category_avg = category2avg[category_value]
-        category_avgs.append(category_avg)
-        category_label = f"'{display_amount_as_nice_str(category_avg, decimal_points=decimal_points)}'"
-        category_labels.append(category_label)
+        assert f'{{value: {n}, text: "{category_value}"}}' in _get_axis_label_fragments(html)
+    s_avgs = df_filtered.groupby(category_field_name, sort=False, observed=True)[field_name].mean()
+    wanted_category_values = [category_value for category_value in category_values_in_expected_order
+        if category_value in category_values_in_data]
+    category_avgs = s_avgs.reindex(wanted_category_values).tolist()  ## raw values with all decimal points so graph accurate
+    category_labels = [f"'{display_amount_as_nice_str(category_avg, decimal_points=decimal_points)}'"
+        for category_avg in category_avgs]  ## rounded values so sensible to read
     vals = f'["vals"] = {category_avgs};'
-    assert vals in html, vals
+    assert vals in _get_vals_fragments(html), vals
     y_labels = "yLbls: [" + ", ".join(category_labels) + "]"
-    assert y_labels in html, y_labels
+    assert y_labels in _get_y_lbls_fragments(html), y_labels
 
 def check_category_sums(*, df_filtered: pd.DataFrame, html: str, field_name: str,
         category_field_name: str, category_values_in_expected_order: Sequence[str], decimal_points: int = 3):
@@ -221,27 +297,22 @@ def check_category_sums(*, df_filtered: pd.DataFrame, html: str, field_name: str
     Values are unrounded averages; labels are rounded
     """
     n_records = len(df_filtered)
-    assert f'conf["n_records"] = "N = {n_records:,}";' in html
+    assert f'conf["n_records"] = "N = {n_records:,}";' in _get_n_records_fragments(html)
     category_values_in_data = df_filtered[category_field_name].unique()
     n = 0
     for category_value in category_values_in_expected_order:
         if category_value not in category_values_in_data:
             continue
         n += 1
-        assert f'{{value: {n}, text: "{category_value}"}}' in html
-    s_sums = df_filtered.groupby(category_field_name)[field_name].sum()
-    category2sum = dict(s_sums.items())
-    category_sums = []  ## raw values with all decimal points so graph accurate
-    category_labels = []  ## rounded values so sensible to read
-    for category_value in category_values_in_expected_order:
-        category_sum = category2sum[category_value]
-        category_sums.append(category_sum)
-        category_label = f"'{display_amount_as_nice_str(category_sum, decimal_points=decimal_points)}'"
-        category_labels.append(category_label)
+        assert f'{{value: {n}, text: "{category_value}"}}' in _get_axis_label_fragments(html)
+    s_sums = df_filtered.groupby(category_field_name, sort=False, observed=True)[field_name].sum()
+    category_sums = s_sums.reindex(category_values_in_expected_order).tolist()  ## raw values with all decimal points so graph accurate
+    category_labels = [f"'{display_amount_as_nice_str(category_sum, decimal_points=decimal_points)}'"
+        for category_sum in category_sums]  ## rounded values so sensible to read
     vals = f'["vals"] = {category_sums};'
-    assert vals in html, vals
+    assert vals in _get_vals_fragments(html), vals
     y_labels = "yLbls: [" + ", ".join(category_labels) + "]"
-    assert y_labels in html, y_labels
+    assert y_labels in _get_y_lbls_fragments(html), y_labels
 
 def check_category_slices(*, df_filtered: pd.DataFrame, html: str,
         category_field_name: str, category_values_in_expected_order: Sequence[str],
@@ -254,27 +325,20 @@ def check_category_slices(*, df_filtered: pd.DataFrame, html: str,
     """
     n_records = len(df_filtered)
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     category_values_in_data = df_filtered[category_field_name].unique()
-    s_freqs = df_filtered.groupby(category_field_name).size()
-    s_pcts = ((100 * df_filtered.groupby(category_field_name).size()) / len(df_filtered))
-    category2freq = dict(s_freqs.items())
-    category2pct = dict(s_pcts.items())
-    items_in_expected_order = []
-    for category_value in category_values_in_expected_order:
-        if category_value not in category_values_in_data:
-            continue
-        category_freq = category2freq[category_value]
-        category_pct = category2pct[category_value]
-        if series_value is not None:
-            filter_lbl = f"{category_value}, {series_value}<br>"
-        elif chart_value is not None:
-            filter_lbl = f"{category_value}, {chart_value}<br>"
-        else:
-            filter_lbl = ''
-        category_slice = (f'{{"val": {category_freq}, "label": "{category_value}", '
-            f'"tool_tip": "{filter_lbl}{category_freq}<br>({display_pct_as_nice_str(category_pct)})"}}')
-        items_in_expected_order.append(category_slice)
+    s_freqs = _get_category_sizes(df_filtered, category_field_name)
+    s_pcts = (100 * s_freqs) / len(df_filtered)  ## reuse the frequencies - same groupby; keep operation order so floats match the charts
+    wanted_category_values = [category_value for category_value in category_values_in_expected_order
+        if category_value in category_values_in_data]
+    category_freqs = s_freqs.reindex(wanted_category_values).tolist()  ## plain Python ints/floats in one pass - no dict build or numpy scalar boxing
+    category_pcts = s_pcts.reindex(wanted_category_values).tolist()
+    filter_lbls = _get_filter_lbls(wanted_category_values, series_value=series_value, chart_value=chart_value)
+    items_in_expected_order = [
+        f'{{"val": {category_freq}, "label": "{category_value}", '
+        f'"tool_tip": "{filter_lbl}{category_freq}<br>({display_pct_as_nice_str(category_pct)})"}}'
+        for category_value, category_freq, category_pct, filter_lbl
+        in zip(wanted_category_values, category_freqs, category_pcts, filter_lbls)]
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
 
 def check_some_points(*, df_filtered: pd.DataFrame, html: str,
@@ -282,32 +346,24 @@ def check_some_points(*, df_filtered: pd.DataFrame, html: str,
         series_value: str | None = None, already_checked_n_records=False):
     _check_n_records(df_filtered=df_filtered, html=html, series_value=series_value,
         already_checked_n_records=already_checked_n_records)
-    df_points = df_filtered.groupby([x_field_name, y_field_name]).size().reset_index()
     sane_n_points_to_check = 100
-    idx: int
-    for idx, row in df_points.iterrows():
-        point_defn = f"{{x: {row[x_field_name]}, y: {row[y_field_name]}}}"
+    ## only distinct (x, y) pairs matter so drop_duplicates does the job of the old groupby().size()
+    ## without counting anything, and itertuples hands back plain scalars
+    ## instead of building a Series per row the way iterrows does
+    df_points = df_filtered[[x_field_name, y_field_name]].drop_duplicates().head(sane_n_points_to_check)
+    for x_val, y_val in df_points.itertuples(index=False, name=None):
+        point_defn = f"{{x: {x_val}, y: {y_val}}}"
         assert point_defn in html, point_defn
-        if idx + 1 == sane_n_points_to_check:
-            break
 
 def check_bins(*, df_filtered: pd.DataFrame, html: str, field_name: str):
     n_records = len(df_filtered)  ## filter to chart
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
-    bin_ranges = [(5, 10), (10, 15), (15, 20), (20, 25), (25, 30), (30, 35), (35, 40), (40, 45), (45, 50), (50, 55),
-        (55, 60), (60, 65), (65, 70), (70, 75), (75, 80), (80, 85), (85, 90), (90, 95),
-        (95, 100),  ## <= instead of the usual <
-    ]
-    vals = []
-    for n, (bin_start, bin_end) in enumerate(bin_ranges, 1):
-        last_bin = (n == len(bin_ranges))
-        if last_bin:
-            df_freq = df_filtered.loc[(df_filtered[field_name] >= bin_start) & (df_filtered[field_name] <= bin_end)]  ## inclusive end
-        else:
-            df_freq = df_filtered.loc[(df_filtered[field_name] >= bin_start) & (df_filtered[field_name] < bin_end)]
-        val = len(df_freq)
-        vals.append(val)
+    assert records in _get_n_records_fragments(html), records
+    bin_edges = np.arange(5, 101, 5)  ## bins 5-<10 ... 95-<=100
+    ## np.histogram shares the tests' bin semantics exactly: every bin is half-open except the last,
+    ## which includes its right edge. One pass over the column instead of two boolean masks
+    ## plus a filtered frame per bin just to call len().
+    vals = np.histogram(df_filtered[field_name].to_numpy(), bins=bin_edges)[0].tolist()
     y_vals = f'data_spec["y_vals"] = {vals}'
     assert y_vals in html, y_vals
 
@@ -318,6 +374,10 @@ def check_boxes(*, df_filtered: pd.DataFrame, html: str, category_field_name: st
     _check_n_records(df_filtered=df_filtered, html=html, series_value=series_value,
         already_checked_n_records=already_checked_n_records)
     category_values_in_data = df_filtered[category_field_name].unique()
+    ## one hash partition instead of a full-length boolean mask per category
+    ## (the quartile / median maths itself has to stay as get_quartiles / statistics.median -
+    ## that is what the generated pages are built from)
+    grouped_vals = df_filtered.groupby(category_field_name, sort=False, observed=True)[field_name]
     i = 0
     for category_value in category_values_in_expected_order:
         if category_value not in category_values_in_data:
@@ -330,7 +390,7 @@ def check_boxes(*, df_filtered: pd.DataFrame, html: str, category_field_name: st
             filter_lbl = category_value
         category_label = f"""box_{series_idx:02}_{i}['indiv_boxlbl'] = "{filter_lbl}";"""
         assert category_label in html, category_label
-        vals = df_filtered.loc[df_filtered[category_field_name] == category_value, field_name].values.tolist()
+        vals = grouped_vals.get_group(category_value).tolist()
         ## calculate quartiles, median etc
         lower_quartile, upper_quartile = get_quartiles(vals)
         box_bottom = lower_quartile
@@ -355,9 +415,9 @@ def test_simple_bar_chart_value_sorted():
         category_field_name='Age Group',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_freqs(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order)
 
@@ -370,9 +430,9 @@ def test_simple_bar_chart_custom_sorted():
         category_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_freqs(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order)
 
@@ -383,9 +443,9 @@ def test_simple_bar_chart_value_sorted_with_missing():
         category_field_name='Age Group',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_freqs(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order)
 
@@ -400,9 +460,9 @@ def test_simple_bar_chart_percents_value_sorted():
         decimal_points=3,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_pcts(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order, decimal_points=design.decimal_points)
 
@@ -417,9 +477,9 @@ def test_simple_bar_chart_percents_custom_sorted():
         decimal_points=3,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_pcts(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order, decimal_points=design.decimal_points)
 
@@ -435,9 +495,9 @@ def test_simple_bar_chart_averages_value_sorted():
         decimal_points=3,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_averages(df_filtered=df, html=html, field_name=design.field_name,
         category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order, decimal_points=design.decimal_points)
@@ -454,9 +514,9 @@ def test_simple_bar_chart_averages_custom_sorted():
         decimal_points=3,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_averages(df_filtered=df, html=html, field_name=design.field_name,
         category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order, decimal_points=design.decimal_points)
@@ -473,9 +533,9 @@ def test_simple_bar_chart_sums_value_sorted():
         decimal_points=3,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_sums(df_filtered=df, html=html, field_name=design.field_name,
         category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order, decimal_points=design.decimal_points)
@@ -492,9 +552,9 @@ def test_simple_bar_chart_sums_custom_sorted():
         decimal_points=3,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_sums(df_filtered=df, html=html, field_name=design.field_name,
         category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order, decimal_points=design.decimal_points)
@@ -509,16 +569,16 @@ def test_multi_chart_bar_chart_value_sorted():
         chart_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order, chart_value=chart_value)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -531,9 +591,9 @@ def test_multi_chart_bar_chart_category_value_sorted():
         chart_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
@@ -541,7 +601,7 @@ def test_multi_chart_bar_chart_category_value_sorted():
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order, chart_value=chart_value)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -556,16 +616,16 @@ def test_multi_chart_bar_chart_charts_value_sorted():
         chart_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order, chart_value=chart_value)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -581,9 +641,9 @@ def test_multi_chart_bar_chart_custom_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
@@ -591,7 +651,7 @@ def test_multi_chart_bar_chart_custom_sorted():
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order, chart_value=chart_value)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -607,9 +667,9 @@ def test_multi_chart_bar_chart_custom_sorted_with_missing():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
@@ -617,7 +677,7 @@ def test_multi_chart_bar_chart_custom_sorted_with_missing():
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order, chart_value=chart_value)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -632,18 +692,18 @@ def test_clustered_bar_chart_value_sorted():
         series_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)  ## when no chart, but series, have to do it here
     record = f'conf["n_records"] = "N = {n_records:,}";'
-    assert record in html, record
+    assert record in _get_n_records_fragments(html), record
     series_values = df[design.series_field_name].unique()
     value_sorted_series_values = sorted(series_values)
     for series_idx, series_value in enumerate(value_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             series_value=series_value, already_checked_n_records=True)
@@ -658,19 +718,19 @@ def test_clustered_bar_chart_category_value_sorted():
         series_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)  ## when no chart, but series, have to do it here
     record = f'conf["n_records"] = "N = {n_records:,}";'
-    assert record in html, record
+    assert record in _get_n_records_fragments(html), record
     series_values = df[design.series_field_name].unique()
     custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
                                                values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     for series_idx, series_value in enumerate(custom_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             series_value=series_value, already_checked_n_records=True)
@@ -685,18 +745,18 @@ def test_clustered_bar_chart_series_value_sorted():
         series_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)  ## when no chart, but series, have to do it here
     record = f'conf["n_records"] = "N = {n_records:,}";'
-    assert record in html, record
+    assert record in _get_n_records_fragments(html), record
     series_values = df[design.series_field_name].unique()
     value_sorted_series_values = sorted(series_values)
     for series_idx, series_value in enumerate(value_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             series_value=series_value, already_checked_n_records=True)
@@ -712,19 +772,19 @@ def test_clustered_bar_chart_custom_sorted():
         series_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)  ## when no chart, but series, have to do it here
     record = f'conf["n_records"] = "N = {n_records:,}";'
-    assert record in html, record
+    assert record in _get_n_records_fragments(html), record
     series_values = df[design.series_field_name].unique()
     custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
         values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     for series_idx, series_value in enumerate(custom_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             series_value=series_value, already_checked_n_records=True)
@@ -740,26 +800,25 @@ def test_multi_chart_clustered_bar_chart_value_sorted():
         chart_field_name='Tertiary Qualifications',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
+    series_values = df[design.series_field_name].unique()
+    value_sorted_series_values = sorted(series_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
-        value_sorted_series_values = sorted(series_values)
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(value_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label  ## series
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True)
@@ -777,28 +836,27 @@ def test_multi_chart_clustered_bar_chart_category_value_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
+    series_values = df[design.series_field_name].unique()
+    custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
+        values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     items_in_expected_order = []
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
-        custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
-            values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(custom_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label  ## series
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True)
@@ -816,27 +874,26 @@ def test_multi_chart_clustered_bar_chart_series_value_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
+    series_values = df[design.series_field_name].unique()
+    value_sorted_series_values = sorted(series_values)
     items_in_expected_order = []
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
-        value_sorted_series_values = sorted(series_values)
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(value_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label  ## series
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True)
@@ -854,27 +911,26 @@ def test_multi_chart_clustered_bar_chart_chart_value_sorted():
         chart_field_name='Tertiary Qualifications',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
+    series_values = df[design.series_field_name].unique()
+    custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
+        values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
-        custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
-            values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(custom_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label  ## series
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True)
@@ -891,26 +947,25 @@ def test_multi_chart_clustered_bar_chart_category_custom_sorted():
         chart_field_name='Tertiary Qualifications',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
+    series_values = df[design.series_field_name].unique()
+    value_sorted_series_values = sorted(series_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
-        value_sorted_series_values = sorted(series_values)
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(value_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label  ## series
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True)
@@ -927,27 +982,26 @@ def test_multi_chart_clustered_bar_chart_series_custom_sorted():
         chart_field_name='Tertiary Qualifications',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
+    series_values = df[design.series_field_name].unique()
+    custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
+        values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
-        custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
-            values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(custom_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label  ## series
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True)
@@ -966,28 +1020,27 @@ def test_multi_chart_clustered_bar_chart_custom_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
+    series_values = df[design.series_field_name].unique()
+    custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
+        values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     items_in_expected_order = []
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
-        custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
-            values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(custom_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label  ## series
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True)
@@ -1004,27 +1057,26 @@ def test_multi_chart_clustered_bar_chart_charts_custom_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
+    series_values = df[design.series_field_name].unique()
+    value_sorted_series_values = sorted(series_values)
     items_in_expected_order = []
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
-        value_sorted_series_values = sorted(series_values)
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(value_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label  ## series
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True)
@@ -1047,28 +1099,27 @@ def test_multi_chart_clustered_percents_bar_chart_custom_sorted():
         decimal_points=3,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
+    series_values = df[design.series_field_name].unique()
+    custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
+        values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     items_in_expected_order = []
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
-            values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(custom_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_pcts(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True, decimal_points=design.decimal_points)
@@ -1084,9 +1135,9 @@ def test_simple_line_chart_value_sorted():
         category_field_name='Age Group',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_freqs(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order)
 
@@ -1099,9 +1150,9 @@ def test_simple_line_chart_custom_sorted():
         category_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_freqs(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order)
 
@@ -1115,18 +1166,18 @@ def test_multi_line_chart_value_sorted():
         series_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     value_sorted_series_values = sorted(series_values)
     for series_idx, series_value in enumerate(value_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             series_value=series_value, already_checked_n_records=True)
@@ -1141,19 +1192,19 @@ def test_multi_line_chart_category_value_sorted():
         series_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
         values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     for series_idx, series_value in enumerate(custom_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             series_value=series_value, already_checked_n_records=True)
@@ -1168,18 +1219,18 @@ def test_multi_line_chart_series_value_sorted():
         series_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     value_sorted_series_values = sorted(series_values)
     for series_idx, series_value in enumerate(value_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             series_value=series_value, already_checked_n_records=True)
@@ -1195,19 +1246,19 @@ def test_multi_line_chart_custom_sorted():
         series_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
         values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     for series_idx, series_value in enumerate(custom_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             series_value=series_value, already_checked_n_records=True)
@@ -1223,19 +1274,19 @@ def test_multi_line_chart_custom_sorted_with_missing():
         series_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
         values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     for series_idx, series_value in enumerate(custom_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             series_value=series_value, already_checked_n_records=True)
@@ -1250,16 +1301,16 @@ def test_multi_chart_line_chart_value_sorted():
         chart_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             chart_value=chart_value, already_checked_n_records=True)
@@ -1275,16 +1326,16 @@ def test_multi_chart_line_chart_charts_value_sorted():
         chart_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             chart_value=chart_value, already_checked_n_records=True)
@@ -1301,9 +1352,9 @@ def test_multi_chart_line_chart_custom_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
@@ -1311,7 +1362,7 @@ def test_multi_chart_line_chart_custom_sorted():
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order,
             chart_value=chart_value, already_checked_n_records=True)
@@ -1328,26 +1379,25 @@ def test_multi_chart_multi_line_chart_value_sorted():
         chart_field_name='Age Group',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
+    series_values = df[design.series_field_name].unique()
+    value_sorted_series_values = sorted(series_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        value_sorted_series_values = sorted(series_values)
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(value_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True)
@@ -1366,28 +1416,27 @@ def test_multi_chart_multi_line_chart_custom_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
+    series_values = df[design.series_field_name].unique()
+    custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
+        values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     items_in_expected_order = []
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
-            values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(custom_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
                 category_values_in_expected_order=category_values_in_expected_order,
                 series_value=series_value, already_checked_n_records=True)
@@ -1403,9 +1452,9 @@ def test_simple_area_chart_value_sorted():
         decimal_points=3,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_freqs(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order, decimal_points=design.decimal_points)
 
@@ -1419,9 +1468,9 @@ def test_simple_area_chart_custom_sorted():
         decimal_points=3,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_freqs(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order, decimal_points=design.decimal_points)
 
@@ -1435,16 +1484,16 @@ def test_multi_chart_area_chart_value_sorted():
         chart_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order, chart_value=chart_value)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -1460,9 +1509,9 @@ def test_multi_chart_area_chart_custom_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
                                               values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
@@ -1470,7 +1519,7 @@ def test_multi_chart_area_chart_custom_sorted():
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_freqs(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order, chart_value=chart_value)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -1484,9 +1533,9 @@ def test_simple_pie_chart_value_sorted():
         category_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_slices(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order)
 
@@ -1499,9 +1548,9 @@ def test_simple_pie_chart_custom_sorted():
         category_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_category_slices(df_filtered=df, html=html, category_field_name=design.category_field_name,
         category_values_in_expected_order=category_values_in_expected_order)
 
@@ -1515,9 +1564,9 @@ def test_multi_chart_pie_chart_value_sorted():
         chart_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
@@ -1525,7 +1574,7 @@ def test_multi_chart_pie_chart_value_sorted():
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_slices(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order, chart_value=chart_value)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -1542,9 +1591,9 @@ def test_multi_chart_pie_chart_custom_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
@@ -1552,7 +1601,7 @@ def test_multi_chart_pie_chart_custom_sorted():
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_slices(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order, chart_value=chart_value)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -1569,9 +1618,9 @@ def test_multi_chart_pie_chart_custom_sorted_with_missing():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
@@ -1579,7 +1628,7 @@ def test_multi_chart_pie_chart_custom_sorted_with_missing():
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_category_slices(df_filtered=df_filtered, html=html, category_field_name=design.category_field_name,
             category_values_in_expected_order=category_values_in_expected_order, chart_value=chart_value)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -1594,9 +1643,9 @@ def test_simple_scatter_plot():
         y_field_name='Reading Score After Help',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_some_points(df_filtered=df, html=html, x_field_name=design.x_field_name, y_field_name=design.y_field_name)
 
 ## scatterplot by series
@@ -1609,18 +1658,18 @@ def test_by_series_scatter_plot_value_sorted():
         series_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     value_sorted_series_values = sorted(series_values)
     for series_idx, series_value in enumerate(value_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_some_points(df_filtered=df_filtered, html=html,
             x_field_name=design.x_field_name, y_field_name=design.y_field_name,
             series_value=series_value, already_checked_n_records=True)
@@ -1635,19 +1684,19 @@ def test_by_series_scatter_plot_custom_sorted():
         series_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
         values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     for series_idx, series_value in enumerate(custom_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_some_points(df_filtered=df_filtered, html=html,
             x_field_name=design.x_field_name, y_field_name=design.y_field_name,
             series_value=series_value, already_checked_n_records=True)
@@ -1662,19 +1711,19 @@ def test_by_series_scatter_plot_custom_sorted_with_missing():
         series_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
         values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     for series_idx, series_value in enumerate(custom_sorted_series_values):
         series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
         assert series_label in html, series_label
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_some_points(df_filtered=df_filtered, html=html,
             x_field_name=design.x_field_name, y_field_name=design.y_field_name,
             series_value=series_value, already_checked_n_records=True)
@@ -1689,16 +1738,16 @@ def test_multi_chart_scatter_plot_value_sorted():
         chart_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_some_points(df_filtered=df_filtered, html=html,
             x_field_name=design.x_field_name, y_field_name=design.y_field_name)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -1713,9 +1762,9 @@ def test_multi_chart_scatter_plot_custom_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
@@ -1723,7 +1772,7 @@ def test_multi_chart_scatter_plot_custom_sorted():
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_some_points(df_filtered=df_filtered, html=html,
             x_field_name=design.x_field_name, y_field_name=design.y_field_name)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
@@ -1739,26 +1788,25 @@ def test_multi_chart_by_series_scatter_plot_value_sorted():
         chart_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
+    series_values = df[design.series_field_name].unique()
+    value_sorted_series_values = sorted(series_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        value_sorted_series_values = sorted(series_values)
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(value_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_some_points(df_filtered=df_filtered, html=html,
                 x_field_name=design.x_field_name, y_field_name=design.y_field_name,
                 series_value=series_value, already_checked_n_records=True)
@@ -1776,28 +1824,27 @@ def test_multi_chart_by_series_scatter_plot_custom_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
+    series_values = df[design.series_field_name].unique()
+    custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
+        values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     items_in_expected_order = []
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        series_values = df[design.series_field_name].unique()
-        custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
-            values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
-        df_chart = df[df[design.chart_field_name] == chart_value]
+        df_chart = _get_group(df, design.chart_field_name, chart_value)
         n_records = len(df_chart)  ## filter to chart
         records = f'conf["n_records"] = "N = {n_records:,}";'
-        assert records in html, records
+        assert records in _get_n_records_fragments(html), records
         for series_idx, series_value in enumerate(custom_sorted_series_values):
             series_label = f'series_{series_idx:>02}["label"] = "{series_value}"'
             assert series_label in html, series_label
-            df_filtered = df.loc[
-                (df[design.chart_field_name] == chart_value) & (df[design.series_field_name] == series_value)]
+            df_filtered = _get_group(df, (design.chart_field_name, design.series_field_name), (chart_value, series_value))
             check_some_points(df_filtered=df_filtered, html=html,
                 x_field_name=design.x_field_name, y_field_name=design.y_field_name,
                 series_value=series_value, already_checked_n_records=True)
@@ -1815,9 +1862,9 @@ def test_simple_histogram():
         field_name='Age',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_bins(df_filtered=df, html=html, field_name=design.field_name)
 
 ## multi-chart histogram
@@ -1829,16 +1876,16 @@ def test_multi_chart_histogram_value_sorted():
         chart_field_name='Country',
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     value_sorted_chart_values = sorted(chart_values)
     items_in_expected_order = []
     for chart_value in value_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_bins(df_filtered=df_filtered, html=html, field_name=design.field_name)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
 
@@ -1851,9 +1898,9 @@ def test_multi_chart_histogram_custom_sorted():
         chart_sort_order=SortOrder.CUSTOM,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     chart_values = df[design.chart_field_name].unique()
     custom_sorted_chart_values = sort_by_text(variable_name=design.chart_field_name,
         values=chart_values, sort_orders=design.sort_orders, sort_order=design.chart_sort_order)
@@ -1861,7 +1908,7 @@ def test_multi_chart_histogram_custom_sorted():
     for chart_value in custom_sorted_chart_values:
         chart_label = f"{design.chart_field_name}: {chart_value}"
         items_in_expected_order.append(chart_label)
-        df_filtered = df.loc[df[design.chart_field_name] == chart_value]
+        df_filtered = _get_group(df, design.chart_field_name, chart_value)
         check_bins(df_filtered=df_filtered, html=html, field_name=design.field_name)
     check_order_even_though_no_sequence_or_indexes(html, items_in_expected_order)
 
@@ -1886,9 +1933,9 @@ def test_simple_box_plot_value_sorted():
         box_plot_type=BoxplotType.INSIDE_1_POINT_5_TIMES_IQR,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_boxes(df_filtered=df, html=html, category_field_name=design.category_field_name, field_name=design.field_name,
         category_values_in_expected_order=category_values_in_expected_order)
 
@@ -1913,9 +1960,9 @@ def test_simple_box_plot_custom_sorted():
         box_plot_type=BoxplotType.INSIDE_1_POINT_5_TIMES_IQR,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     check_boxes(df_filtered=df, html=html, category_field_name=design.category_field_name, field_name=design.field_name,
         category_values_in_expected_order=category_values_in_expected_order)
 
@@ -1932,16 +1979,16 @@ def test_clustered_box_plot_value_sorted():
         box_plot_type=BoxplotType.INSIDE_1_POINT_5_TIMES_IQR,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)  ## filter to chart
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     value_sorted_series_values = sorted(series_values)
     for series_idx, series_value in enumerate(value_sorted_series_values):
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_boxes(df_filtered=df_filtered, html=html,
             category_field_name=design.category_field_name, field_name=design.field_name,
             category_values_in_expected_order=category_values_in_expected_order,
@@ -1961,17 +2008,17 @@ def test_clustered_box_plot_custom_sorted():
         box_plot_type=BoxplotType.INSIDE_1_POINT_5_TIMES_IQR,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)  ## filter to chart
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
         values=series_values, sort_orders=design.sort_orders, sort_order=series_sort_order)
     for series_idx, series_value in enumerate(custom_sorted_series_values):
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_boxes(df_filtered=df_filtered, html=html,
             category_field_name=design.category_field_name, field_name=design.field_name,
             category_values_in_expected_order=category_values_in_expected_order,
@@ -1990,17 +2037,17 @@ def test_clustered_box_plot_custom_sorted_with_missing():
         box_plot_type=BoxplotType.INSIDE_1_POINT_5_TIMES_IQR,
     )
     # design.make_output()
-    html = design.to_html_design().html_item_str
-    print(html)
-    df = pd.read_csv(design.csv_file_path)
+    html = _get_html(design)
+    print_html_for_debugging(html)
+    df = get_cached_df(design.csv_file_path)
     n_records = len(df)  ## filter to chart
     records = f'conf["n_records"] = "N = {n_records:,}";'
-    assert records in html, records
+    assert records in _get_n_records_fragments(html), records
     series_values = df[design.series_field_name].unique()
     custom_sorted_series_values = sort_by_text(variable_name=design.series_field_name,
         values=series_values, sort_orders=design.sort_orders, sort_order=design.series_sort_order)
     for series_idx, series_value in enumerate(custom_sorted_series_values):
-        df_filtered = df.loc[df[design.series_field_name] == series_value]
+        df_filtered = _get_group(df, design.series_field_name, series_value)
         check_boxes(df_filtered=df_filtered, html=html,
             category_field_name=design.category_field_name, field_name=design.field_name,
             category_values_in_expected_order=category_values_in_expected_order,
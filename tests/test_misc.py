@@ -1,6 +1,38 @@
+from sofastats.output.utils import to_precision
 from sofastats.utils.misc import correct_str_dps
 
 
+def test_to_precision():
+    """
+    Expected values match the original webkit-derived implementation,
+    except that digit-string ties now round to nearest via C '%e' formatting
+    rather than depending on floating-point noise in the old distance comparison
+    (e.g. 0.0012345 is actually stored as 0.00123449999... so rounds down).
+    """
+    tests = [
+        (0, 3, '0.00'),
+        (0.0001, 4, '1.000e-4'),
+        (0.001, 4, '1.000e-3'),
+        (0.0012345, 4, '1.234e-3'),
+        (0.05, 2, '0.050'),
+        (0.5, 1, '0.5'),
+        (0.999, 4, '0.9990'),
+        (0.9999, 3, '1.00'),
+        (2 / 3, 4, '0.6667'),
+        (1, 4, '1.000'),
+        (9.999, 3, '10.0'),
+        (123.456, 4, '123.5'),
+        (123456, 4, '1.235e+5'),
+        (123456, 6, '123456'),
+        (-0.0012345, 4, '-1.234e-3'),
+        (-123.456, 4, '-123.5'),
+        (1e-10, 4, '1.000e-10'),
+        (1234567.89, 3, '1.23e+6'),
+    ]
+    for num, precision, expected in tests:
+        actual = to_precision(num, precision)
+        assert actual == expected, (num, precision, expected, actual)
+
 def test_correct_str_dps():
     """
     Apply decimal points to floats only - leave Freq integers alone.
@@ -7,7 +7,7 @@ from sofastats.output.tables.interfaces import Column, Metric, Row
 from tests.conf import (
     handedness_custom_sorted, people_csv_fpath, sleep_groups_custom_sorted, sort_orders_yaml_file_path)
 from tests.utils import (display_amount_as_nice_str, display_float_fraction_as_nice_pct_str,
-    found_amount_sequence_in_html_table, sort_index_following_pattern)
+    found_amount_sequence_in_html_table, print_html_for_debugging, sort_index_following_pattern)
 import pandas as pd
 
 def test_cross_tab():
@@ -35,7 +35,7 @@ def test_cross_tab():
         decimal_points=decimal_points,
     )
     html = design.to_html_design().html_item_str
-    print(html)
+    print_html_for_debugging(html)
     df = pd.read_csv(csv_file_path)
     table_html = html[html.index('<table'):]  ## e.g. <table id="T_02ac2">
     found_amount_sequence = partial(found_amount_sequence_in_html_table, text=table_html, debug=True)
@@ -89,7 +89,7 @@ def test_simple_freq_table():
         decimal_points=decimal_points,
     )
     html = design.to_html_design().html_item_str
-    print(html)
+    print_html_for_debugging(html)
     df = pd.read_csv(csv_file_path)
     table_html = html[html.index('<table'):]  ## e.g. <table id="T_02ac2">
     found_amount_sequence = partial(found_amount_sequence_in_html_table, text=table_html, debug=True)
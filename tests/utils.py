@@ -1,19 +1,44 @@
 from collections.abc import Sequence
+from functools import lru_cache, partial
+import os
+from pathlib import Path
 import re
 from typing import Any
 
 import pandas as pd
 from sofastats.utils.misc import display_float_as_nice_str
 
+@lru_cache(maxsize=None)
+def get_cached_df(csv_fpath: Path) -> pd.DataFrame:
+    """
+    The tests re-read the same handful of CSVs over and over to recompute expected values independently
+    of the designs being tested. Parse each file once per session instead.
+    Callers must treat the returned df as read-only (filtering / groupby are fine - both make new objects).
+
+    String columns become categoricals - they are all low-cardinality grouping columns
+    (Age Group, Country etc) and the many groupbys then hash small integer codes rather than strings.
+    """
+    df = pd.read_csv(csv_fpath)
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].astype('category')
+    return df
+
+def print_html_for_debugging(html: str):
+    """
+    Each generated page is tens of KB and pytest captures and buffers everything tests print,
+    even on a pass - so stay silent by default and only dump the page when actually debugging.
+    """
+    if os.environ.get('SOFASTATS_DEBUG_HTML'):
+        print(html)
+
 def display_float_fraction_as_nice_pct_str(*, float_fraction: float, decimal_points: int = 3) -> str:
     raw_pct = round(100 * float_fraction, decimal_points)
     return display_float_as_nice_str(raw=raw_pct, decimal_points=decimal_points, show_pct=False)
 
-def display_amount_as_nice_str(raw: float, *, decimal_points: int = 3) -> str:
-    return display_float_as_nice_str(raw, decimal_points=decimal_points, show_pct=False)
-
-def display_pct_as_nice_str(raw: float, *, decimal_points: int = 3) -> str:
-    return display_float_as_nice_str(raw, decimal_points=decimal_points, show_pct=True)
+## bound once - partials skip a wrapper frame and kwargs dict per call in the label-building loops
+display_amount_as_nice_str = partial(display_float_as_nice_str, show_pct=False)
+display_pct_as_nice_str = partial(display_float_as_nice_str, show_pct=True)
 
 def strip_unnecessary_decimal_point_from_str_val(raw: str) -> str:
     if raw[-2:] == '.0':